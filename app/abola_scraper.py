@@ -4,6 +4,7 @@ import feedparser
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
+from .http_cache import get_validator_store
 
 logger = logging.getLogger(__name__)
 
@@ -64,6 +65,10 @@ class ABolaScraper(BaseScraper):
 
         return list(links)
 
+    def is_valid_feed_link(self, url):
+        """Only individual article pages from the RSS feed (same rule as the HTML listing)"""
+        return _is_valid_article(url)
+
     def find_next_page_url(self, html, current_url):
         # A Bola uses ?page=N for pagination
         from urllib.parse import urlparse, urlunparse, parse_qs, urlencode
@@ -90,12 +95,12 @@ class ABolaScraper(BaseScraper):
         logger.debug(f"Calculated next page for A Bola: {next_page_url}")
         return next_page_url
 
-    def list_pages(self, start_url, max_pages=3, section=None):
+    def list_pages(self, start_url, max_pages=3, section=None, **kwargs):
         """
         Overrides BaseScraper.list_pages to add an RSS fallback.
         """
         # First, try the standard HTML scraping method
-        html_links = super().list_pages(start_url, max_pages, section)
+        html_links = super().list_pages(start_url, max_pages, section, **kwargs)
         if html_links:
             return html_links
 
@@ -109,9 +114,12 @@ class ABolaScraper(BaseScraper):
                 return []
 
             logger.info(f"[abola/{section}] Fetching RSS fallback from {rss_url}")
-            response = self.session.get(rss_url, timeout=15)
-            response.raise_for_status()
-            feed = feedparser.parse(response.content)
+            content, validators = self._fetch_listing(rss_url)
+            if content is None:
+                cached_links = (validators or {}).get('links') or []
+                logger.info(f"[abola/{section}] RSS not modified, reusing {len(cached_links)} cached links.")
+                return cached_links
+            feed = feedparser.parse(content)
             
             rss_links = []
             for entry in feed.entries:
@@ -119,8 +127,11 @@ class ABolaScraper(BaseScraper):
                 if _is_valid_article(link):
                     rss_links.append(link)
             
+            rss_links = list(dict.fromkeys(rss_links)) # Deduplicate
+            if validators:
+                get_validator_store().save(rss_url, validators.get('etag'), validators.get('last_modified'), rss_links)
             logger.info(f"[abola/{section}] Found {len(rss_links)} valid links via RSS fallback.")
-            return list(dict.fromkeys(rss_links)) # Deduplicate
+            return rss_links
         except Exception as e:
             logger.exception(f"[abola/{section}] RSS fallback failed: {e}")
             return []
\ No newline at end of file
@@ -3,17 +3,109 @@ Base scraper class that defines the interface for all news site scrapers
 """
 
 import logging
+import re
 import requests
 import json
-from urllib.robotparser import RobotFileParser
+import threading
+import calendar
+import os
+import feedparser
 from abc import ABC, abstractmethod
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 from .utils import normalize_date, extract_mime_type, get_user_agent
+from .fetch_engine import get_fetch_engine
+from .http_cache import get_validator_store, get_response_cache, DEFAULT_CACHE_TTL
+from .rate_limiter import get_rate_limiter
+from .robots_cache import get_robots_cache, ROBOTS_ENFORCE
+from .parsed_document import ParsedDocument
+from .fast_extractor import fallback_metadata as fast_fallback_metadata, get_parity_monitor
+from .parse_pool import get_parse_pool
 
 logger = logging.getLogger(__name__)
 
+# Head-only fetches stop reading at </head> or at the first Article JSON-LD block
+HEAD_CHUNK_SIZE = 16384
+_HEAD_END_RE = re.compile(rb'</head\s*>', re.IGNORECASE)
+_LD_JSON_RE = re.compile(
+    rb'<script[^>]+application/ld\+json[^>]*>(.*?)</script\s*>', re.IGNORECASE | re.DOTALL
+)
+_ARTICLE_TYPES = ('Article', 'NewsArticle', 'BlogPosting')
+
+# Pagination stops once this fraction of a listing page's links is already stored
+KNOWN_URL_THRESHOLD = float(os.environ.get("KNOWN_URL_THRESHOLD", "0.8"))
+
+# Per-source counters of known-URL early termination, exposed in /admin/stats
+_pagination_stats = {}
+_pagination_stats_lock = threading.Lock()
+
+
+def _record_pagination(site, **counts):
+    with _pagination_stats_lock:
+        entry = _pagination_stats.setdefault(site, {'listings': 0, 'stopped_early': 0, 'pages_saved': 0})
+        for name, value in counts.items():
+            entry[name] += value
+
+
+def get_pagination_stats():
+    """Listing walks per site, how many stopped on known URLs and the page fetches that saved."""
+    with _pagination_stats_lock:
+        return {site: dict(counts) for site, counts in _pagination_stats.items()}
+
+# RSS ingestion: a feed item is used as is only when it has all of these
+FEED_REQUIRED_FIELDS = ('title', 'description', 'date_published')
+# Validator-store key prefix of feed items, kept apart from the link lists of list_pages
+FEED_VALIDATOR_PREFIX = 'feed:'
+
+# Per-source counters of head-only fetches, exposed in /admin/stats
+_head_fetch_stats = {}
+_head_fetch_stats_lock = threading.Lock()
+
+
+def _record_head_fetch(site, **counts):
+    with _head_fetch_stats_lock:
+        entry = _head_fetch_stats.setdefault(
+            site, {'fetches': 0, 'fallbacks': 0, 'bytes_read': 0, 'bytes_saved': 0}
+        )
+        for name, value in counts.items():
+            entry[name] += value
+
+
+def get_head_fetch_stats():
+    """Head-only fetch counters per site: fetches, full-page fallbacks, bytes read and saved."""
+    with _head_fetch_stats_lock:
+        return {site: dict(counts) for site, counts in _head_fetch_stats.items()}
+
+
+def _head_incomplete(article):
+    """
+    True when an article parsed from a head-only fetch lacks what the article JSON-LD
+    provides. A head without it still yields a title (from <title>), but no date.
+    """
+    return not article or not article.get('title') or not article.get('date_published')
+
+
+def _has_article_json_ld(buffer):
+    """True when buffer contains a complete JSON-LD block describing an article."""
+    for match in _LD_JSON_RE.finditer(buffer):
+        try:
+            data = json.loads(match.group(1).decode('utf-8', errors='replace'))
+        except ValueError:
+            continue
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            for node in item.get('@graph', [item]):
+                node_type = node.get('@type') if isinstance(node, dict) else None
+                if isinstance(node_type, list):
+                    if any(t in _ARTICLE_TYPES for t in node_type):
+                        return True
+                elif node_type in _ARTICLE_TYPES:
+                    return True
+    return False
+
 def _should_retry_http_request(exception: BaseException) -> bool:
     """
     Predicate for tenacity to decide if a request should be retried.
@@ -55,10 +147,14 @@ class BaseScraper(ABC):
     
     def __init__(self, store, request_delay=1.0):
         self.store = store
+        # Kept for API compatibility; politeness is enforced by the per-host rate limiter
         self.request_delay = request_delay
+        self.cache_ttl = DEFAULT_CACHE_TTL  # seconds; overridden per source by ScraperFactory
+        self.head_only = False  # stream only the document head of articles; set per source by ScraperFactory
+        self.extractor = 'soup'  # 'soup' (BeautifulSoup) or 'lxml' (fast path); set per source by ScraperFactory
+        self.known_url_threshold = KNOWN_URL_THRESHOLD  # set per source by ScraperFactory; None disables
         self.session = requests.Session()
         self.session.headers.update({'User-Agent': get_user_agent()})
-        self.robots_cache = {}
     
     @abstractmethod
     def get_site_domain(self):
@@ -107,55 +203,106 @@ class BaseScraper(ABC):
             return False  # Include article if filter evaluation fails
     
     def can_fetch(self, url):
-        """Check if we can fetch the URL according to robots.txt"""
+        """Check if we can fetch the URL according to robots.txt (shared, TTL-bound cache)"""
         try:
-            from urllib.parse import urlparse
-            domain = urlparse(url).netloc
-            
-            if domain not in self.robots_cache:
-                robots_url = f"https://{domain}/robots.txt"
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                try:
-                    rp.read()
-                    self.robots_cache[domain] = rp
-                except Exception as e:
-                    logger.warning(f"Could not read robots.txt for {domain}: {e}")
-                    # If we can't read robots.txt, assume we can fetch
-                    self.robots_cache[domain] = None
-            
-            rp = self.robots_cache[domain]
-            if rp is None:
-                return True
-            
             user_agent = self.session.headers.get('User-Agent', get_user_agent())
-            can_fetch = rp.can_fetch(user_agent, url)
+            allowed = get_robots_cache().can_fetch(url, user_agent)
+            logger.debug(f"Robots check for {url} with UA '{user_agent[:50]}...': {allowed}")
             
-            logger.debug(f"Robots check for {url} with UA '{user_agent[:50]}...': {can_fetch}")
-            
-            # If robots.txt says no but we know the site allows scraping, proceed with caution
-            if not can_fetch:
-                logger.info(f"Robots parser returned False for {self.get_site_domain()}, but robots.txt allows all. Proceeding.")
-            
-            return True  # We generally allow scraping for news sites
+            if not allowed and not ROBOTS_ENFORCE:
+                logger.info(f"Robots.txt disallows {url} for {self.get_site_domain()}, but ROBOTS_ENFORCE is off. Proceeding.")
+                return True
+            return allowed
             
         except Exception as e:
             logger.warning(f"Error checking robots.txt for {url}: {e}")
             return True
     
+    def _send(self, url, headers=None, timeout=15, stream=False):
+        """
+        Issue a GET through the scraper session. All scraper requests go through
+        here, so this is where the per-host rate limit is enforced. Inside the fetch
+        engine the token was already waited for in the event loop and this does not block.
+        """
+        get_rate_limiter().acquire(url)
+        return self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+    
     @retry(
         stop=stop_after_attempt(2), 
         wait=wait_exponential(multiplier=1, min=2, max=5),
         retry=retry_if_exception(_should_retry_http_request)
     )
-    def _fetch_page(self, url):
-        """Fetch a single page with retries (optimized for performance)"""
+    def _fetch_listing(self, url, cache_key=None):
+        """
+        Fetch a listing page or feed with a conditional GET.
+        
+        Returns a tuple (html, validators). On a 200, html is the page content and
+        validators holds the response's ETag/Last-Modified. On a 304, html is None
+        and validators is the stored entry, including the links extracted last time.
+        Validators are looked up under cache_key (default: the URL itself).
+        """
+        if not self.can_fetch(url):
+            logger.warning(f"Robots.txt disallows fetching {url}")
+            return None, None
+        
+        cached = get_validator_store().get(cache_key or url)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        try:
+            response = self._send(url, headers=headers or None)
+            if response.status_code == 304 and cached:
+                logger.debug(f"Not modified: {url}")
+                return None, cached
+            response.raise_for_status()
+            response.encoding = 'utf-8'
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+            return response.text, validators
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error fetching {url}: {e}")
+            raise
+    
+    def _fetch_page(self, url, head_only=False):
+        """
+        Fetch a single page, serving it from the shared response cache when possible.
+        With head_only, only the document head is downloaded (see _download_head) and
+        it is cached separately from the full page.
+        """
+        variant = 'head' if head_only else None
+        cache = get_response_cache()
+        content = cache.get(url, variant=variant)
+        if content is None and head_only:
+            # A cached full page serves head-only callers as well
+            content = cache.get(url)
+        if content is not None:
+            logger.debug(f"Response cache hit for {url}")
+            return content
+        
         if not self.can_fetch(url):
             logger.warning(f"Robots.txt disallows fetching {url}")
             return None
         
+        content = self._download_head(url) if head_only else self._download(url)
+        if content:
+            cache.put(url, content, ttl=self.cache_ttl, source=self.get_site_domain(), variant=variant)
+        return content
+    
+    @retry(
+        stop=stop_after_attempt(2), 
+        wait=wait_exponential(multiplier=1, min=2, max=5),
+        retry=retry_if_exception(_should_retry_http_request)
+    )
+    def _download(self, url):
+        """Download a single page with retries (optimized for performance)"""
         try:
-            response = self.session.get(url, timeout=15)  # Reduced timeout
+            response = self._send(url, timeout=15)  # Reduced timeout
             response.raise_for_status()
             response.encoding = 'utf-8'
             content = response.text
@@ -166,22 +313,119 @@ class BaseScraper(ABC):
             logger.error(f"Request error fetching {url}: {e}")
             raise
     
-    def list_pages(self, start_url, max_pages=3, section=None):
-        """Get article links from multiple pages starting from start_url"""
+    @retry(
+        stop=stop_after_attempt(2), 
+        wait=wait_exponential(multiplier=1, min=2, max=5),
+        retry=retry_if_exception(_should_retry_http_request)
+    )
+    def _download_head(self, url):
+        """
+        Stream a page and stop reading once the metadata is in: at </head>, or as
+        soon as a complete Article/NewsArticle JSON-LD block has been received.
+        Returns the (possibly truncated) HTML.
+        """
+        try:
+            response = self._send(url, timeout=15, stream=True)
+            try:
+                response.raise_for_status()
+                buffer = bytearray()
+                scanned = 0
+                complete = True
+                for chunk in response.iter_content(HEAD_CHUNK_SIZE):
+                    buffer.extend(chunk)
+                    # Re-scan a small overlap so tags split across chunks are still found
+                    window = bytes(buffer[max(0, scanned - 64):])
+                    scanned = len(buffer)
+                    if _HEAD_END_RE.search(window) or (
+                            b'ld+json' in buffer and _has_article_json_ld(bytes(buffer))):
+                        complete = False
+                        break
+                head = buffer.decode('utf-8', errors='replace')
+                self._check_head_response(url, response, head, complete)
+                # Compressed bytes actually pulled off the wire
+                bytes_read = response.raw.tell() or len(buffer)
+                total = response.headers.get('Content-Length')
+            finally:
+                response.close()
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Request error fetching {url}: {e}")
+            raise
+        
+        saved = max(int(total) - bytes_read, 0) if total and total.isdigit() else 0
+        _record_head_fetch(self.get_site_domain(), fetches=1, bytes_read=bytes_read, bytes_saved=saved)
+        logger.debug(f"Head-only fetch of {url}: read {bytes_read} bytes, saved {saved}")
+        return head
+    
+    def _check_head_response(self, url, response, head, complete):
+        """
+        Hook for the checks a subclass runs in its _download override (soft blocks
+        and the like), which head-only fetches bypass. complete is True when the
+        whole body was read. Raise to reject the response.
+        """
+        pass
+    
+    def parse_articles(self, urls, source=None, section=None):
+        """
+        Parse several articles concurrently through the shared fetch engine.
+        Returns a list aligned with ``urls``; entries are None for articles
+        that could not be fetched or parsed.
+        """
+        urls = list(urls)
+        results = get_fetch_engine().map(self.parse_article, urls, source=source, section=section)
+        articles = []
+        for url, result in zip(urls, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error parsing article {url}: {result}")
+                result = None
+            articles.append(result)
+        return articles
+    
+    def _known_fraction(self, links, source, section):
+        """Fraction of links already in the store for source/section (0.0 without a store)"""
+        if not links or not hasattr(self.store, 'get_conn'):
+            return 0.0
+        from . import store as store_module
+        conn = self.store.get_conn()
+        try:
+            known = store_module.known_urls(conn, links, source=source, section=section)
+        finally:
+            conn.close()
+        return len(known) / len(links)
+    
+    def list_pages(self, start_url, max_pages=3, section=None, source=None, stop_on_known=False):
+        """
+        Get article links from multiple pages starting from start_url.
+        
+        With stop_on_known, each page's links are checked against the store in bulk and
+        pagination stops once known_url_threshold of them are already stored: older
+        pages would only hold articles we have too.
+        """
         all_links = []
         current_url = start_url
+        stop_on_known = stop_on_known and self.known_url_threshold is not None
+        if stop_on_known:
+            _record_pagination(self.get_site_domain(), listings=1)
         
         for page_num in range(max_pages):
             try:
                 logger.info(f"Fetching page {page_num + 1}: {current_url}")
-                html = self._fetch_page(current_url)
+                html, validators = self._fetch_listing(current_url)
                 
-                if not html:
+                if html is None and validators:
+                    # 304 Not Modified: reuse the links extracted from the last full response
+                    page_links = [link for link in validators.get('links') or [] if isinstance(link, str)]
+                    next_url = validators.get('next_url')
+                    logger.info(f"Page {page_num + 1} not modified, reusing {len(page_links)} cached links")
+                elif not html:
                     logger.warning(f"No content received from {current_url}")
                     break
+                else:
+                    # Extract article links from current page (in the parse pool)
+                    page_links, next_url = get_parse_pool().call(self, 'extract_listing', html, current_url, section)
+                    if validators:
+                        get_validator_store().save(current_url, validators.get('etag'),
+                                                   validators.get('last_modified'), page_links, next_url)
                 
-                # Extract article links from current page
-                page_links = self.extract_article_links(html, current_url, section=section)
                 if not page_links:
                     logger.warning(f"No article links found on page {page_num + 1}")
                     break
@@ -189,18 +433,21 @@ class BaseScraper(ABC):
                 all_links.extend(page_links)
                 logger.info(f"Found {len(page_links)} article links on page {page_num + 1}")
                 
-                # Find next page URL
+                if stop_on_known and page_num < max_pages - 1:
+                    known = self._known_fraction(page_links, source, section)
+                    if known >= self.known_url_threshold:
+                        saved = max_pages - page_num - 1
+                        _record_pagination(self.get_site_domain(), stopped_early=1, pages_saved=saved)
+                        logger.info(f"{known:.0%} of page {page_num + 1} links already stored; "
+                                    f"stopping pagination (saved up to {saved} page fetches)")
+                        break
+                
+                # Move on to the next page
                 if page_num < max_pages - 1:
-                    next_url = self.find_next_page_url(html, current_url)
                     if not next_url or next_url == current_url:
                         logger.info("No more pages found")
                         break
                     current_url = next_url
-                
-                # Delay between requests
-                if self.request_delay > 0:
-                    import time
-                    time.sleep(self.request_delay)
                     
             except Exception as e:
                 logger.error(f"Error processing page {page_num + 1} ({current_url}): {e}")
@@ -209,20 +456,128 @@ class BaseScraper(ABC):
         logger.info(f"Total article links collected: {len(all_links)}")
         return all_links
     
-    def parse_json_ld(self, html):
-        """Extract JSON-LD metadata from article page"""
-        soup = BeautifulSoup(html, 'lxml')
+    def extract_listing(self, html, url, section=None):
+        """Article links and next page URL of a listing page; runs in a parse worker process"""
+        page_links = self.extract_article_links(html, url, section=section)
+        next_url = self.find_next_page_url(html, url) if page_links else None
+        return page_links, next_url
+    
+    def is_valid_feed_link(self, url):
+        """Whether a feed item link is an article worth ingesting; overridden per source"""
+        return bool(url) and url.startswith('http')
+    
+    def parse_feed(self, content):
+        """
+        Turn RSS/Atom content into plain item dicts (JSON-serializable strings only,
+        so they can be stored with the feed validators). Runs in a parse worker process.
+        """
+        feed = feedparser.parse(content)
+        items = []
+        for entry in feed.entries:
+            link = (entry.get('link') or '').strip()
+            if not self.is_valid_feed_link(link):
+                continue
+            
+            description = entry.get('summary') or ''
+            if '<' in description:
+                description = BeautifulSoup(description, 'lxml').get_text(' ', strip=True)
+            
+            image = ''
+            for media in (entry.get('media_content') or []) + (entry.get('media_thumbnail') or []):
+                if media.get('url') and media.get('medium', 'image') == 'image':
+                    image = media['url']
+                    break
+            if not image:
+                for enclosure in entry.get('enclosures') or []:
+                    if (enclosure.get('type') or '').startswith('image/') and enclosure.get('href'):
+                        image = enclosure['href']
+                        break
+            
+            items.append({
+                'link': link,
+                'title': (entry.get('title') or '').strip(),
+                'description': description.strip(),
+                'image': image,
+                'author': (entry.get('author') or '').strip(),
+                # feedparser normalizes every date format to a UTC struct_time
+                'published': self._feed_date(entry.get('published_parsed')) or entry.get('published', ''),
+                'updated': self._feed_date(entry.get('updated_parsed')) or entry.get('updated', ''),
+            })
+        return items
+    
+    @staticmethod
+    def _feed_date(parsed):
+        if not parsed:
+            return ''
+        return datetime.fromtimestamp(calendar.timegm(parsed), tz=timezone.utc).isoformat()
+    
+    def read_feed(self, feed_url, section=None):
+        """
+        Fetch an official RSS feed with a conditional GET and return its items.
+        On 304 Not Modified the items stored with the validators are returned.
+        Items are stored under their own key: list_pages keeps plain links for the same URL.
+        """
+        cache_key = FEED_VALIDATOR_PREFIX + feed_url
+        content, validators = self._fetch_listing(feed_url, cache_key=cache_key)
+        if content is None:
+            cached = (validators or {}).get('links') or []
+            items = [item for item in cached if isinstance(item, dict) and item.get('link')]
+            logger.info(f"Feed {feed_url} not modified, reusing {len(items)} cached items")
+            return items
         
-        # Find all JSON-LD scripts
-        scripts = soup.find_all('script', {'type': 'application/ld+json'})
+        items = get_parse_pool().call(self, 'parse_feed', content)
+        if validators:
+            get_validator_store().save(cache_key, validators.get('etag'), validators.get('last_modified'), items)
+        logger.info(f"Read {len(items)} items from feed {feed_url} for section '{section}'")
+        return items
+    
+    def feed_item_to_article(self, item, source=None, section=None):
+        """Article dict built from a feed item, in the same shape parse_article returns"""
+        return {
+            'url': item['link'],
+            'title': (item.get('title') or '').strip(),
+            'description': (item.get('description') or '').strip(),
+            'image': clean_image_url((item.get('image') or '').strip()),
+            'author': (item.get('author') or '').strip(),
+            'date_published': normalize_date(item.get('published') or item.get('updated')),
+            'date_modified': normalize_date(item.get('updated')),
+            'fetched_at': datetime.now(timezone.utc),
+            'source': source or 'unknown',
+            'section': section or 'general',
+            'site': self.get_site_domain()
+        }
+    
+    def complete_feed_articles(self, articles, source=None, section=None):
+        """
+        Fetch the article page only for feed articles missing a required field,
+        filling in the gaps from the page. Returns a list aligned with ``articles``.
+        """
+        incomplete = [a for a in articles if not all(a.get(f) for f in FEED_REQUIRED_FIELDS)]
+        if incomplete:
+            logger.info(f"{len(incomplete)} of {len(articles)} feed items are incomplete, fetching their pages")
+            pages = self.parse_articles([a['url'] for a in incomplete], source=source, section=section)
+            for article, page in zip(incomplete, pages):
+                if not page:
+                    continue
+                for key, value in page.items():
+                    if not article.get(key):
+                        article[key] = value
         
-        for script in scripts:
+        completed = []
+        for article in articles:
+            if not article.get('title'):
+                logger.warning(f"Skipping feed item without title: {article['url']}")
+                completed.append(None)
+            else:
+                completed.append(article)
+        return completed
+    
+    def parse_json_ld(self, html):
+        """Extract JSON-LD metadata from article page (raw HTML or a ParsedDocument)"""
+        doc = ParsedDocument.of(html)
+        
+        for data in doc.json_ld:
             try:
-                script_content = getattr(script, 'string', None) or ''
-                if not script_content or not isinstance(script_content, str):
-                    continue
-                data = json.loads(script_content)
-                
                 # Handle different JSON-LD structures
                 items = []
                 
@@ -241,7 +596,7 @@ class BaseScraper(ABC):
                         if item_type in ['Article', 'NewsArticle', 'BlogPosting']:
                             return self._extract_article_metadata(item)
                             
-            except (json.JSONDecodeError, KeyError) as e:
+            except KeyError as e:
                 logger.warning(f"Error parsing JSON-LD: {e}")
                 continue
         
@@ -294,8 +649,15 @@ class BaseScraper(ABC):
         return metadata
     
     def extract_fallback_metadata(self, html, url):
-        """Extract fallback metadata from HTML meta tags"""
-        soup = BeautifulSoup(html, 'lxml')
+        """Extract fallback metadata from HTML meta tags (raw HTML or a ParsedDocument)"""
+        doc = ParsedDocument.of(html, url)
+        if doc.uses_lxml:
+            metadata = fast_fallback_metadata(doc.tree)
+            if metadata.get('image'):
+                metadata['image'] = clean_image_url(str(metadata['image']))
+            return metadata
+        
+        soup = doc.soup
         metadata = {}
         
         # Title fallback
@@ -317,26 +679,83 @@ class BaseScraper(ABC):
         
         return metadata
     
+    def _extract_metadata(self, doc, url):
+        """JSON-LD metadata, completed with HTML meta tags for missing fields"""
+        # Try JSON-LD first
+        metadata = self.parse_json_ld(doc)
+        
+        # Fallback to HTML meta tags
+        if not metadata or not metadata.get('title'):
+            fallback = self.extract_fallback_metadata(doc, url)
+            if not metadata:
+                metadata = fallback
+            else:
+                # Merge fallback data for missing fields
+                for key, value in fallback.items():
+                    if not metadata.get(key):
+                        metadata[key] = value
+        return metadata
+    
+    def _parse_metadata(self, html, url):
+        """
+        Parse the page once and extract its metadata with the configured extractor.
+        A sample of fast-path (lxml) results is checked against BeautifulSoup; see fast_extractor.
+        """
+        site = self.get_site_domain()
+        monitor = get_parity_monitor()
+        if self.extractor != 'lxml' or not monitor.enabled(site):
+            return self._extract_metadata(ParsedDocument(html, url), url)
+        
+        metadata = self._extract_metadata(ParsedDocument(html, url, extractor='lxml'), url)
+        if not metadata or not metadata.get('title') or monitor.should_check(site):
+            reference = self._extract_metadata(ParsedDocument(html, url), url)
+            if metadata and metadata.get('title'):
+                monitor.record(site, url, metadata, reference)
+            return reference
+        return metadata
+    
+    def parse_settings(self):
+        """Per-source attributes a parse worker must copy onto its own scraper instance"""
+        extractor = self.extractor
+        # Parity mismatches are decided here, in the parent: workers get 'soup' once a site is off
+        if extractor == 'lxml' and not get_parity_monitor().enabled(self.get_site_domain()):
+            extractor = 'soup'
+        return {'extractor': extractor}
+    
     def parse_article(self, url, source=None, section=None):
-        """Parse individual article and extract metadata"""
+        """Fetch an article and extract its metadata (parsing runs in the parse pool)"""
         try:
-            html = self._fetch_page(url)
+            html = self._fetch_page(url, head_only=self.head_only)
             if not html:
                 return None
             
-            # Try JSON-LD first
-            metadata = self.parse_json_ld(html)
+            article = get_parse_pool().call(self, 'parse_article_html', html, url, source, section)
             
-            # Fallback to HTML meta tags
-            if not metadata or not metadata.get('title'):
-                fallback = self.extract_fallback_metadata(html, url)
-                if not metadata:
-                    metadata = fallback
-                else:
-                    # Merge fallback data for missing fields
-                    for key, value in fallback.items():
-                        if not metadata.get(key):
-                            metadata[key] = value
+            if self.head_only and _head_incomplete(article):
+                # The head was not enough (e.g. JSON-LD rendered in the body): fetch the full page.
+                # The truncated head must not keep answering from the cache until its TTL runs out.
+                logger.debug(f"Head-only metadata incomplete for {url}, fetching full page")
+                _record_head_fetch(self.get_site_domain(), fallbacks=1)
+                get_response_cache().delete(url, variant='head')
+                html = self._fetch_page(url)
+                if not html:
+                    return None
+                article = get_parse_pool().call(self, 'parse_article_html', html, url, source, section)
+            
+            return article
+            
+        except Exception as e:
+            logger.error(f"Error parsing article {url}: {e}")
+            return None
+    
+    def parse_article_html(self, html, url, source=None, section=None):
+        """
+        Build the article dict from already fetched HTML. Pure CPU work with no
+        network or database access, so it can run in a parse worker process.
+        """
+        try:
+            # Parsed once, shared by the JSON-LD and meta tag extractors
+            metadata = self._parse_metadata(html, url)
             
             if not metadata:
                 return None
@@ -379,7 +798,7 @@ class BaseScraper(ABC):
         all_article_urls = []
         for start_url in start_urls:
             logger.info(f"Scraping from: {start_url}")
-            article_urls = self.list_pages(start_url, max_pages)
+            article_urls = self.list_pages(start_url, max_pages, section=section, source=source, stop_on_known=True)
             all_article_urls.extend(article_urls)
         
         # Remove duplicates while preserving order
@@ -394,41 +813,40 @@ class BaseScraper(ABC):
             logger.warning("No article URLs found")
             return []
         
-        # Process each article
-        new_articles = []
-        for i, url in enumerate(article_urls):
-            try:
-                logger.info(f"Processing article {i+1}/{len(article_urls)}: {url}")
-                
-                # Check if we already have this article
-                if self.store.has_article(url):
-                    logger.debug(f"Article already exists: {url}")
-                    continue
-                
-                # Parse article
-                article = self.parse_article(url, source=source, section=section)
-                if not article:
-                    logger.warning(f"Could not parse article: {url}")
-                    continue
-                
-                # Apply filters
-                if filters and self._should_filter_article(article, filters):
-                    logger.info(f"Article filtered out: {url}")
-                    continue
-                
-                # Store article
-                if self.store.upsert_article(article):
-                    new_articles.append(article)
-                    logger.info(f"Stored article: {article['title']}")
-                
-                # Delay between requests
-                if self.request_delay > 0:
-                    import time
-                    time.sleep(self.request_delay)
+        from . import store as store_module
+        conn = self.store.get_conn()
+        try:
+            # Skip articles we already have (bulk lookup), then fetch and parse the rest concurrently
+            known = store_module.known_urls(conn, article_urls, source, section)
+            pending_urls = [url for url in article_urls if url not in known]
+            
+            logger.info(f"Processing {len(pending_urls)} new article(s) out of {len(article_urls)}")
+            parsed = self.parse_articles(pending_urls, source=source, section=section)
+            
+            kept = []
+            for url, article in zip(pending_urls, parsed):
+                try:
+                    if not article:
+                        logger.warning(f"Could not parse article: {url}")
+                        continue
                     
-            except Exception as e:
-                logger.error(f"Error processing article {url}: {e}")
-                continue
+                    # Apply filters
+                    if filters and self._should_filter_article(article, filters):
+                        logger.info(f"Article filtered out: {url}")
+                        continue
+                    
+                    kept.append(article)
+                        
+                except Exception as e:
+                    logger.error(f"Error processing article {url}: {e}")
+                    continue
+            
+            # Store all articles in one transaction; only the really new rows come back
+            new_articles = store_module.upsert_many(conn, kept)
+            for article in new_articles:
+                logger.info(f"Stored article: {article['title']}")
+        finally:
+            conn.close()
         
         logger.info(f"Scraping completed. New articles: {len(new_articles)}")
         return new_articles
@@ -8,7 +8,7 @@ logger = logging.getLogger(__name__)
 
 def safe_get_stats():
     """Safely fetches statistics from the data store."""
-    store = store_module.ArticleStore()
+    store = store_module.get_store()
     conn = store.get_conn()
     try:
         stats = store_module.get_stats(conn)
@@ -0,0 +1,118 @@
+"""
+Streaming RSS 2.0 / Atom 1.0 writer.
+
+Writes the feed XML directly from the channel metadata and article fields, as
+str chunks, instead of building a feedgen object graph and an lxml tree and
+pretty-printing it. The output is byte-for-byte what feedgen 1.0 produces for
+the fields FeedGenerator sets (same element order, escaping, indentation and
+date formats), so the two paths can be swapped per endpoint.
+
+Only values feedgen/lxml would serialize without complaint are supported;
+FeedGenerator checks entries with _entry_fields() and falls back to feedgen for
+anything else.
+"""
+
+import re
+
+# Characters lxml refuses to serialize (not allowed in XML 1.0)
+_INVALID_XML_CHARS = re.compile('[^\t\n\r\x20-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]')
+
+_DAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8'?>\n"
+
+
+def is_xml_text(value):
+    """True for a non-empty str that can be written as XML text."""
+    return isinstance(value, str) and bool(value) and not _INVALID_XML_CHARS.search(value)
+
+
+def _text(value):
+    # Escaped like libxml2 does for text nodes (chained replace beats str.translate here)
+    return value.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;').replace('\r', '&#13;')
+
+
+def _attr(value):
+    return (_text(value).replace('"', '&quot;')
+            .replace('\n', '&#10;').replace('\t', '&#9;'))
+
+
+def _rfc2822(dt):
+    """Same as feedgen's formatRFC2822 (strftime under the C locale), without touching the locale."""
+    return f"{_DAYS[dt.weekday()]}, {dt.day:02d} {_MONTHS[dt.month - 1]} {dt.year} {dt.strftime('%H:%M:%S %z')}"
+
+
+def iter_rss(channel, entries, updated):
+    """
+    Yields the RSS 2.0 document in chunks.
+
+    channel: FeedGenerator._channel_metadata() dict; entries: (link, title,
+    description, date, author) tuples in document order; updated: lastBuildDate.
+    """
+    head = [
+        XML_DECLARATION,
+        '<rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">\n',
+        '  <channel>\n',
+        f"    <title>{_text(channel['title'])}</title>\n",
+        # feedgen uses the last link added for the RSS <link>, which is the self link
+        f"    <link>{_text(channel['self_link'])}</link>\n",
+        f"    <description>{_text(channel['description'])}</description>\n",
+        f"    <atom:link href=\"{_attr(channel['self_link'])}\" rel=\"self\" type=\"{_attr(channel['self_type'])}\"/>\n",
+        '    <docs>http://www.rssboard.org/rss-specification</docs>\n',
+        f"    <generator>{_text(channel['generator'])}</generator>\n",
+    ]
+    if channel['language']:
+        head.append(f"    <language>{_text(channel['language'])}</language>\n")
+    head.append(f"    <lastBuildDate>{_rfc2822(updated)}</lastBuildDate>\n")
+    head.append(f"    <managingEditor>{_text(channel['managing_editor'])}</managingEditor>\n")
+    head.append(f"    <ttl>{channel['ttl']}</ttl>\n")
+    head.append(f"    <webMaster>{_text(channel['web_master'])}</webMaster>\n")
+    yield ''.join(head)
+
+    for link, title, description, date, _author in entries:
+        link = _text(link)
+        # RSS authors need an e-mail address, so feedgen leaves name-only authors out
+        yield (
+            '    <item>\n'
+            f'      <title>{_text(title)}</title>\n'
+            f'      <link>{link}</link>\n'
+            f'      <description>{_text(description)}</description>\n'
+            f'      <guid isPermaLink="true">{link}</guid>\n'
+            f'      <pubDate>{_rfc2822(date)}</pubDate>\n'
+            '    </item>\n'
+        )
+    yield '  </channel>\n</rss>\n'
+
+
+def iter_atom(channel, entries, updated):
+    """Yields the Atom 1.0 document in chunks; arguments as for iter_rss."""
+    lang = f" xml:lang=\"{_attr(channel['language'])}\"" if channel['language'] else ''
+    yield (
+        XML_DECLARATION
+        + f'<feed xmlns="http://www.w3.org/2005/Atom"{lang}>\n'
+        + f"  <id>{_text(channel['id'])}</id>\n"
+        + f"  <title>{_text(channel['title'])}</title>\n"
+        + f"  <updated>{updated.isoformat()}</updated>\n"
+        + f"  <link href=\"{_attr(channel['alternate_link'])}\" rel=\"alternate\"/>\n"
+        + f"  <link href=\"{_attr(channel['self_link'])}\" rel=\"self\" type=\"{_attr(channel['self_type'])}\"/>\n"
+        + f"  <generator>{_text(channel['generator'])}</generator>\n"
+        + f"  <subtitle>{_text(channel['description'])}</subtitle>\n"
+    )
+
+    for link, title, description, date, author in entries:
+        date = date.isoformat()
+        author = f'    <author>\n      <name>{_text(author)}</name>\n    </author>\n' if author else ''
+        # feedgen 1.0 never writes rel on entry links
+        yield (
+            '  <entry>\n'
+            f'    <id>{_text(link)}</id>\n'
+            f'    <title>{_text(title)}</title>\n'
+            f'    <updated>{date}</updated>\n'
+            f'{author}'
+            f'    <content>{_text(description)}</content>\n'
+            f'    <link href="{_attr(link)}"/>\n'
+            f'    <published>{date}</published>\n'
+            '  </entry>\n'
+        )
+    yield '</feed>\n'
@@ -5,9 +5,13 @@ from urllib.parse import urlparse
 from feedgen.feed import FeedGenerator as FG
 from .utils import extract_mime_type, deduplicate_articles, best_dt
 from .sources_config import SOURCES_CONFIG
+from . import feed_writer
 
 logger = logging.getLogger(__name__)
 
+# best_dt's value for articles without any usable date
+_NO_DATE = datetime.min.replace(tzinfo=timezone.utc)
+
 class FeedGenerator:
     def __init__(self):
         self.base_info = {
@@ -20,37 +24,108 @@ class FeedGenerator:
         }
         self.brasilia_tz = ZoneInfo("America/Sao_Paulo")
     
-    def _create_base_feed(self, source='lance', section='futebol', feed_format='rss', title=None, description=None):
-        """Create base feed with source-specific or custom metadata"""
-        fg = FG()
-        
+    def _channel_metadata(self, source='lance', section='futebol', feed_format='rss', title=None, description=None):
+        """Channel-level values shared by the feedgen and streaming writers"""
         source_config = SOURCES_CONFIG.get(source, SOURCES_CONFIG['lance'])
         section_config = source_config['sections'].get(section, list(source_config['sections'].values())[0])
         
-        unique_id = f"https://lance-feeds.repl.co/feeds/{source}/{section}/{feed_format}"
-        fg.id(unique_id)
+        return {
+            'id': f"https://lance-feeds.repl.co/feeds/{source}/{section}/{feed_format}",
+            'title': title or f"{source_config['name']} - {section_config['name']} - Feed não oficial",
+            'description': description or section_config['description'],
+            'alternate_link': source_config['base_url'],
+            'self_link': f'https://lance-feeds.repl.co/feeds/{source}/{section}/{feed_format}',
+            'self_type': f'application/{feed_format}+xml',
+            'language': source_config.get('language', 'pt-BR'),
+            'generator': 'Multi-Source Feed Generator v1.0',
+            'ttl': 30,
+            'managing_editor': 'noreply@lance-feeds.repl.co (Multi-Source Feed Bot)',
+            'web_master': 'noreply@lance-feeds.repl.co (Multi-Source Feed Bot)',
+        }
+    
+    def _create_base_feed(self, source='lance', section='futebol', feed_format='rss', title=None, description=None):
+        """Create base feed with source-specific or custom metadata"""
+        fg = FG()
+        channel = self._channel_metadata(source, section, feed_format, title, description)
         
-        if title:
-            fg.title(title)
-        else:
-            fg.title(f"{source_config['name']} - {section_config['name']} - Feed não oficial")
-
-        if description:
-            fg.description(description)
-        else:
-            fg.description(section_config['description'])
-
-        fg.link(href=source_config['base_url'], rel='alternate')
-        fg.language(source_config.get('language', 'pt-BR'))
-        fg.generator('Multi-Source Feed Generator v1.0')
-        fg.ttl(30)  # Add TTL
+        fg.id(channel['id'])
+        fg.title(channel['title'])
+        fg.description(channel['description'])
+
+        fg.link(href=channel['alternate_link'], rel='alternate')
+        fg.language(channel['language'])
+        fg.generator(channel['generator'])
+        fg.ttl(channel['ttl'])  # Add TTL
         
         fg.lastBuildDate(datetime.now(timezone.utc).astimezone(self.brasilia_tz))
-        fg.managingEditor('noreply@lance-feeds.repl.co (Multi-Source Feed Bot)')
-        fg.webMaster('noreply@lance-feeds.repl.co (Multi-Source Feed Bot)')
+        fg.managingEditor(channel['managing_editor'])
+        fg.webMaster(channel['web_master'])
         
         return fg
     
+    def _entry_fields(self, article, pub_date):
+        """
+        (link, title, description, date, author) for the streaming writer, or None
+        when the article needs feedgen's own handling (missing link, title or date,
+        non-text values or characters XML cannot carry). pub_date is best_dt(article).
+        """
+        link = article.get('link') or article.get('url')
+        title = article.get('title')
+        description = article.get('summary') or article.get('description') or title
+        author = article.get('author')
+        if not (feed_writer.is_xml_text(link) and feed_writer.is_xml_text(title)
+                and feed_writer.is_xml_text(description)):
+            return None
+        if author and not feed_writer.is_xml_text(author):
+            return None
+        if pub_date == _NO_DATE:
+            return None
+        return link, title, description, pub_date.astimezone(self.brasilia_tz), author
+    
+    def _sorted_articles(self, articles):
+        """
+        Deduplicated articles, newest first, and their best_dt in the same order.
+        Dates are parsed once per article (dateutil dominates the render time).
+        """
+        # 1. Deduplicate articles
+        dedup_articles = deduplicate_articles(articles)
+
+        # 2. Sort articles reverse-chronologically
+        dated = sorted(
+            ((best_dt(it) or _NO_DATE, it) for it in dedup_articles),
+            key=lambda pair: pair[0],
+            reverse=True
+        )
+        dates = [dt for dt, _ in dated]
+
+        # 3. Sanity check the sort order
+        for i in range(len(dates) - 1):
+            di = dates[i]
+            dj = dates[i+1]
+            if di and dj and di < dj:
+                logger.error(f"Feed items out of order: {di} (index {i}) < {dj} (index {i+1})")
+                break
+        return [it for _, it in dated], dates
+    
+    def _stream(self, iter_feed, sorted_articles, dates, channel):
+        """
+        Renders with the streaming writer; None if an article needs the feedgen path.
+        feedgen prepends every added entry, so its documents list the articles oldest
+        first; the streaming writer keeps that order to stay byte-compatible.
+        """
+        entries = []
+        for article, pub_date in zip(reversed(sorted_articles), reversed(dates)):
+            fields = self._entry_fields(article, pub_date)
+            if fields is None:
+                logger.debug(f"Falling back to feedgen for {article.get('link') or article.get('url')}")
+                return None
+            entries.append(fields)
+        if entries:
+            updated = entries[-1][3]
+        else:
+            updated = datetime.now(timezone.utc).astimezone(self.brasilia_tz)
+        return ''.join(iter_feed(channel, entries, updated))
+    
     def _add_article_to_feed(self, fg, article):
         """Add a single article to the feed"""
         try:
@@ -94,30 +169,20 @@ class FeedGenerator:
             logger.error(f"Error adding article to feed: {article.get('link') or article.get('url')}: {e}", exc_info=True)
             return False
     
-    def generate_rss(self, articles, source='lance', section='futebol', title=None, description=None):
-        """Generate RSS 2.0 feed"""
+    def generate_rss(self, articles, source='lance', section='futebol', title=None, description=None, writer='feedgen'):
+        """Generate RSS 2.0 feed (writer: 'feedgen' or 'stream', see feed_writer)"""
         try:
+            sorted_articles, dates = self._sorted_articles(articles)
+            if writer == 'stream':
+                channel = self._channel_metadata(source, section, 'rss', title, description)
+                feed_content = self._stream(feed_writer.iter_rss, sorted_articles, dates, channel)
+                if feed_content is not None:
+                    logger.info(f"Generated RSS feed with {len(sorted_articles)} articles (streamed)")
+                    return feed_content
+
             fg = self._create_base_feed(source=source, section=section, feed_format='rss', title=title, description=description)
             
             fg.link(href=f'https://lance-feeds.repl.co/feeds/{source}/{section}/rss', rel='self', type='application/rss+xml')
-            
-            # 1. Deduplicate articles
-            dedup_articles = deduplicate_articles(articles)
-
-            # 2. Sort articles reverse-chronologically
-            sorted_articles = sorted(
-                dedup_articles,
-                key=lambda it: best_dt(it) or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True
-            )
-
-            # 3. Sanity check the sort order
-            for i in range(len(sorted_articles) - 1):
-                di = best_dt(sorted_articles[i])
-                dj = best_dt(sorted_articles[i+1])
-                if di and dj and di < dj:
-                    logger.error(f"Feed items out of order: {di} (index {i}) < {dj} (index {i+1})")
-                    break
 
             added_count = 0
             for article in sorted_articles:
@@ -125,8 +190,7 @@ class FeedGenerator:
                     added_count += 1
             
             if sorted_articles:
-                newest_article = sorted_articles[0]
-                pub_date = best_dt(newest_article)
+                pub_date = dates[0]
                 if pub_date:
                     fg.lastBuildDate(pub_date.astimezone(self.brasilia_tz))
 
@@ -137,39 +201,28 @@ class FeedGenerator:
             logger.error(f"Error generating RSS feed: {e}")
             raise
     
-    def generate_atom(self, articles, source='lance', section='futebol', title=None, description=None):
-        """Generate Atom 1.0 feed"""
+    def generate_atom(self, articles, source='lance', section='futebol', title=None, description=None, writer='feedgen'):
+        """Generate Atom 1.0 feed (writer: 'feedgen' or 'stream', see feed_writer)"""
         try:
+            sorted_articles, dates = self._sorted_articles(articles)
+            if writer == 'stream':
+                channel = self._channel_metadata(source, section, 'atom', title, description)
+                feed_content = self._stream(feed_writer.iter_atom, sorted_articles, dates, channel)
+                if feed_content is not None:
+                    logger.info(f"Generated Atom feed with {len(sorted_articles)} articles (streamed)")
+                    return feed_content
+
             fg = self._create_base_feed(source=source, section=section, feed_format='atom', title=title, description=description)
             
             fg.link(href=f'https://lance-feeds.repl.co/feeds/{source}/{section}/atom', rel='self', type='application/atom+xml')
             
-            # 1. Deduplicate articles
-            dedup_articles = deduplicate_articles(articles)
-
-            # 2. Sort articles reverse-chronologically
-            sorted_articles = sorted(
-                dedup_articles,
-                key=lambda it: best_dt(it) or datetime.min.replace(tzinfo=timezone.utc),
-                reverse=True
-            )
-
-            # 3. Sanity check the sort order
-            for i in range(len(sorted_articles) - 1):
-                di = best_dt(sorted_articles[i])
-                dj = best_dt(sorted_articles[i+1])
-                if di and dj and di < dj:
-                    logger.error(f"Feed items out of order: {di} (index {i}) < {dj} (index {i+1})")
-                    break
-            
             added_count = 0
             for article in sorted_articles:
                 if self._add_article_to_feed(fg, article):
                     added_count += 1
             
             if sorted_articles:
-                newest_article = sorted_articles[0]
-                pub_date = best_dt(newest_article)
+                pub_date = dates[0]
                 if pub_date:
                     fg.updated(pub_date.astimezone(self.brasilia_tz))
                 else:
@@ -0,0 +1,112 @@
+"""
+Asyncio fetch engine shared by all scrapers.
+
+The scrapers are synchronous (requests + BeautifulSoup) and are called from
+Flask request threads and from the APScheduler thread. The engine runs a single
+event loop in a daemon thread and fans blocking work (fetch + parse of a URL)
+out to a thread pool, bounded by a global concurrency cap and a per-host cap.
+Because the loop and its semaphores are process-wide, the caps hold across all
+callers at the same time, not just within one section scrape.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+from .rate_limiter import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = int(os.environ.get("FETCH_MAX_CONCURRENCY", "16"))
+DEFAULT_PER_HOST_CONCURRENCY = int(os.environ.get("FETCH_PER_HOST_CONCURRENCY", "4"))
+
+
+class FetchEngine:
+    """Runs blocking per-URL callables concurrently with global and per-host limits."""
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 per_host_concurrency: int = DEFAULT_PER_HOST_CONCURRENCY):
+        self.max_concurrency = max(1, max_concurrency)
+        self.per_host_concurrency = max(1, per_host_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="fetch")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        # Semaphores are only touched from the loop thread.
+        self._global_sem: Optional[asyncio.Semaphore] = None
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or not self._thread or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="fetch-engine", daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+                self._global_sem = None
+                self._host_sems = {}
+                logger.info(f"Fetch engine started (global={self.max_concurrency}, per_host={self.per_host_concurrency})")
+            return self._loop
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_sems[host] = sem
+        return sem
+
+    async def run_one(self, func: Callable[..., Any], url: str, *args, **kwargs) -> Any:
+        """Runs ``func(url, *args, **kwargs)`` in the pool once both caps allow it."""
+        if self._global_sem is None:
+            self._global_sem = asyncio.Semaphore(self.max_concurrency)
+        host = urlparse(url).netloc.lower()
+        loop = asyncio.get_running_loop()
+        limiter = get_rate_limiter()
+        # Host slot first: a task queued behind a busy host must not sit on a global
+        # slot that a fetch to another host could use. The same goes for the rate
+        # limit, so the token is waited for here rather than in the pool thread.
+        async with self._host_semaphore(host):
+            wait = limiter.reserve(url)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            async with self._global_sem:
+                call = functools.partial(limiter.run_prepaid, url, func, url, *args, **kwargs)
+                return await loop.run_in_executor(self._executor, call)
+
+    async def gather(self, func: Callable[..., Any], urls: Iterable[str], *args, **kwargs) -> List[Any]:
+        """Coroutine form of :meth:`map`; exceptions are returned in place of results."""
+        tasks = [self.run_one(func, url, *args, **kwargs) for url in urls]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def map(self, func: Callable[..., Any], urls: Iterable[str], *args, **kwargs) -> List[Any]:
+        """
+        Calls ``func(url, *args, **kwargs)`` for every URL concurrently and blocks
+        until all are done. Results keep the input order; a call that raised
+        yields the exception object instead of a result.
+        """
+        urls = list(urls)
+        if not urls:
+            return []
+        loop = self._ensure_loop()
+        future = asyncio.run_coroutine_threadsafe(self.gather(func, urls, *args, **kwargs), loop)
+        return future.result()
+
+
+_engine: Optional[FetchEngine] = None
+_engine_lock = threading.Lock()
+
+
+def get_fetch_engine() -> FetchEngine:
+    """Returns the process-wide fetch engine, creating it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = FetchEngine()
+        return _engine
@@ -29,21 +29,14 @@ class G1Scraper(BaseScraper):
         return "g1.globo.com"
 
     @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=2, max=5))
-    def _fetch_page(self, url):
+    def _download(self, url):
         """Override to use enhanced browser headers and add resilience for G1."""
-        if not self.can_fetch(url):
-            logger.warning(f"Robots.txt disallows fetching {url}")
-            return None
-        
         try:
             # The headers are already in self.session from __init__
-            response = self.session.get(url, timeout=15)
+            response = self._send(url, timeout=15)
             response.raise_for_status()
             
-            # Check for minimal content to detect soft blocks or JS-only pages
-            if not response.text or len(response.text) < 5000: # G1 pages are usually large
-                logger.warning(f"Received minimal content for {url} (len: {len(response.text)}). Possible block or JS-heavy page.")
-            
+            self._warn_if_minimal(url, response.text)
             return response.text
         except requests.exceptions.HTTPError as e:
             logger.error(f"HTTP error fetching {url}: {e.response.status_code}. The scraper is likely being blocked.")
@@ -52,6 +45,16 @@ class G1Scraper(BaseScraper):
             logger.error(f"Error fetching {url}: {e}")
             raise
 
+    def _check_head_response(self, url, response, head, complete):
+        """Head-only fetches get the same soft-block check when the whole body was read"""
+        if complete:
+            self._warn_if_minimal(url, head)
+
+    def _warn_if_minimal(self, url, text):
+        # Check for minimal content to detect soft blocks or JS-only pages
+        if not text or len(text) < 5000: # G1 pages are usually large
+            logger.warning(f"Received minimal content for {url} (len: {len(text or '')}). Possible block or JS-heavy page.")
+
     def extract_article_links(self, html, base_url, section=None):
         """Extract article links from G1 pages"""
         if not html:
@@ -0,0 +1,299 @@
+"""
+HTTP caching helpers for the scrapers.
+
+ValidatorStore keeps the ETag / Last-Modified validators of listing pages and
+official RSS feeds, together with the links extracted from the last full
+response. On the next cycle the scraper sends a conditional GET and, when the
+server answers 304 Not Modified, reuses the stored links without downloading
+or parsing the page again.
+
+ResponseCache is an on-disk cache of article pages. Bodies are stored as files
+addressed by the SHA-256 of the canonical URL, with an SQLite index holding
+expiry (per-source TTL) and last access times used for LRU eviction once the
+cache grows past its byte budget.
+
+Everything lives under data/ so it survives restarts and is shared by all
+gunicorn workers. Each thread keeps one connection to the index (as ArticleStore
+does), and the cache size is tracked per process between periodic full counts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_DB = os.environ.get("HTTP_CACHE_DB", os.path.join("data", "http_cache.db"))
+HTTP_CACHE_DIR = os.environ.get("HTTP_CACHE_DIR", os.path.join("data", "http_cache"))
+HTTP_CACHE_MAX_BYTES = int(os.environ.get("HTTP_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+DEFAULT_CACHE_TTL = int(os.environ.get("HTTP_CACHE_TTL", str(6 * 3600)))  # seconds
+# A hit refreshes last_access only when the stored one is older than this (seconds)
+LAST_ACCESS_RESOLUTION = 60
+# Puts between full SUM(size) counts; other workers' writes are only seen on a count
+SIZE_RECOUNT_PUTS = 100
+
+_local = threading.local()
+
+
+def _open_connection(db_path):
+    directory = os.path.dirname(db_path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(db_path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def _connect(db_path):
+    """
+    Returns this thread's connection to db_path, opening it on first use. A forked
+    child (gunicorn worker) opens its own instead of reusing the parent's.
+    """
+    conns = getattr(_local, 'conns', None)
+    if conns is None or _local.pid != os.getpid():
+        conns = _local.conns = {}
+        _local.pid = os.getpid()
+    conn = conns.get(db_path)
+    if conn is None:
+        conn = conns[db_path] = _open_connection(db_path)
+    return conn
+
+
+class ValidatorStore:
+    """Persists conditional GET validators and the link list of the matching response."""
+
+    def __init__(self, db_path=HTTP_CACHE_DB):
+        self.db_path = db_path
+        conn = _connect(self.db_path)
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS listing_validators (
+                    url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT,
+                    links TEXT NOT NULL, next_url TEXT, updated_at REAL NOT NULL
+                )
+            ''')
+
+    def get(self, url):
+        """Returns the stored validators for url, or None if the URL was never seen."""
+        try:
+            row = _connect(self.db_path).execute(
+                "SELECT etag, last_modified, links, next_url FROM listing_validators WHERE url = ?", (url,)
+            ).fetchone()
+        except Exception as e:
+            logger.warning(f"Could not read validators for {url}: {e}")
+            return None
+        if not row:
+            return None
+        return {
+            'etag': row[0],
+            'last_modified': row[1],
+            'links': json.loads(row[2]),
+            'next_url': row[3],
+        }
+
+    def save(self, url, etag, last_modified, links, next_url=None):
+        """Stores the validators of a full (200) response along with its extracted links."""
+        if not etag and not last_modified:
+            return
+        try:
+            with _connect(self.db_path) as conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO listing_validators (url, etag, last_modified, links, next_url, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (url, etag, last_modified, json.dumps(list(links)), next_url, time.time()))
+        except Exception as e:
+            logger.warning(f"Could not save validators for {url}: {e}")
+
+
+class ResponseCache:
+    """Content-addressed on-disk cache of response bodies with TTL and LRU eviction."""
+
+    def __init__(self, db_path=HTTP_CACHE_DB, cache_dir=HTTP_CACHE_DIR, max_bytes=HTTP_CACHE_MAX_BYTES):
+        self.db_path = db_path
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+        # Bytes in the cache as last counted plus what this process stored since;
+        # None forces a full count (and possibly an eviction) on the next put
+        self._size = None
+        self._puts_since_count = 0
+        os.makedirs(self.cache_dir, exist_ok=True)
+        conn = _connect(self.db_path)
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY, url TEXT NOT NULL, source TEXT, size INTEGER NOT NULL,
+                    stored_at REAL NOT NULL, expires_at REAL NOT NULL, last_access REAL NOT NULL
+                )
+            ''')
+            conn.execute('CREATE INDEX IF NOT EXISTS ix_responses_last_access ON responses (last_access)')
+
+    @staticmethod
+    def key_for(url, variant=None):
+        """
+        Cache key of a URL: the SHA-256 of its canonical form. A variant (e.g. 'head'
+        for head-only fetches) is stored under its own key.
+        """
+        from .utils import canonical_url
+        address = canonical_url(url) or url
+        if variant:
+            address = f"{address}\x00{variant}"
+        return hashlib.sha256(address.encode('utf-8')).hexdigest()
+
+    def _path_for(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def _count(self, hit):
+        with self._counter_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, url, variant=None):
+        """Returns the cached body for url, or None on a miss or an expired entry."""
+        key = self.key_for(url, variant)
+        now = time.time()
+        try:
+            conn = _connect(self.db_path)
+            row = conn.execute("SELECT expires_at, last_access FROM responses WHERE key = ?", (key,)).fetchone()
+            if not row or row[0] < now:
+                self._count(False)
+                return None
+            with open(self._path_for(key), 'r', encoding='utf-8') as f:
+                body = f.read()
+            # LRU order only needs to be coarse: skip the write for recently used entries
+            if now - row[1] >= LAST_ACCESS_RESOLUTION:
+                with conn:
+                    conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        except FileNotFoundError:
+            # Evicted by another worker between the index lookup and the read
+            self._count(False)
+            return None
+        except Exception as e:
+            logger.warning(f"Response cache read failed for {url}: {e}")
+            self._count(False)
+            return None
+        self._count(True)
+        return body
+
+    def put(self, url, body, ttl=DEFAULT_CACHE_TTL, source=None, variant=None):
+        """Stores body for url, then evicts least recently used entries if over budget."""
+        if not body or ttl <= 0:
+            return
+        key = self.key_for(url, variant)
+        path = self._path_for(key)
+        data = body.encode('utf-8')
+        now = time.time()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            conn = _connect(self.db_path)
+            with conn:
+                conn.execute('''
+                    INSERT OR REPLACE INTO responses (key, url, source, size, stored_at, expires_at, last_access)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (key, url, source, len(data), now, now + ttl, now))
+            with self._counter_lock:
+                self._puts_since_count += 1
+                if self._size is not None and self._puts_since_count < SIZE_RECOUNT_PUTS:
+                    # Overcounts a replaced entry until the next full count, which only makes that count come sooner
+                    self._size += len(data)
+                check = self._size is None or self._size > self.max_bytes or \
+                    self._puts_since_count >= SIZE_RECOUNT_PUTS
+            if check:
+                self._evict(conn)
+        except Exception as e:
+            logger.warning(f"Response cache write failed for {url}: {e}")
+
+    def delete(self, url, variant=None):
+        """Drops the cached body for url (e.g. a head that turned out to be incomplete)."""
+        key = self.key_for(url, variant)
+        try:
+            with _connect(self.db_path) as conn:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            os.remove(self._path_for(key))
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Response cache delete failed for {url}: {e}")
+
+    def _evict(self, conn):
+        """Counts the cache size and evicts entries until it is within max_bytes."""
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_bytes:
+            evicted = 0
+            # Expired entries go first, then the least recently used ones
+            rows = conn.execute(
+                "SELECT key, size FROM responses ORDER BY (expires_at < ?) DESC, last_access ASC", (time.time(),)
+            ).fetchall()
+            with conn:
+                for key, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    try:
+                        os.remove(self._path_for(key))
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    evicted += 1
+            logger.info(f"Response cache evicted {evicted} entries (now {total} bytes)")
+        with self._counter_lock:
+            self._size = total
+            self._puts_since_count = 0
+
+    def stats(self):
+        """Hit/miss counters of this process plus the size of the shared cache."""
+        entries, size = 0, 0
+        try:
+            entries, size = _connect(self.db_path).execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        except Exception as e:
+            logger.warning(f"Could not read response cache stats: {e}")
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': round(self.hits / lookups, 3) if lookups else 0.0,
+            'entries': entries,
+            'bytes': size,
+            'max_bytes': self.max_bytes,
+        }
+
+
+_validator_store = None
+_validator_store_lock = threading.Lock()
+
+
+def get_validator_store():
+    """Returns the process-wide ValidatorStore, creating it on first use."""
+    global _validator_store
+    with _validator_store_lock:
+        if _validator_store is None:
+            _validator_store = ValidatorStore()
+        return _validator_store
+
+
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """Returns the process-wide ResponseCache, creating it on first use."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
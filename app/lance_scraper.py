@@ -10,6 +10,7 @@ from urllib.parse import urljoin, urlparse
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from .base_scraper import BaseScraper
+from .parsed_document import ParsedDocument
 from .utils import get_user_agent
 
 logger = logging.getLogger(__name__)
@@ -102,15 +103,15 @@ class LanceScraper(BaseScraper):
     
     def parse_article_metadata(self, html, url):
         """Parse article metadata from LANCE! article page"""
-        soup = BeautifulSoup(html, 'lxml')
+        doc = ParsedDocument.of(html, url)
         
         # Try JSON-LD first (most reliable)
-        json_ld_data = self.parse_json_ld(html)
+        json_ld_data = self.parse_json_ld(doc)
         if json_ld_data:
             return json_ld_data
         
         # Fallback to meta tags
-        return self._parse_meta_tags(soup, url)
+        return self._parse_meta_tags(doc.soup, url)
     
     def _parse_meta_tags(self, soup, url):
         """Parse article metadata from meta tags"""
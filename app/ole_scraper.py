@@ -4,8 +4,9 @@ import re
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from .base_scraper import BaseScraper
+from .parsed_document import ParsedDocument
 from .utils import normalize_date
-from datetime import datetime
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
@@ -177,16 +178,13 @@ class OleScraper(BaseScraper):
             
         return final_links
 
-    def parse_article(self, url: str, source: str | None = None, section: str | None = None) -> dict | None:
+    def parse_article_html(self, html: str, url: str, source: str | None = None, section: str | None = None) -> dict | None:
         """
         Parses an Olé article, with strict validation for type and section.
         """
         try:
-            html = self._fetch_page(url)
-            if not html:
-                return None
-            
-            soup = BeautifulSoup(html, "lxml")
+            # One parse shared by validation and metadata extraction
+            doc = ParsedDocument(html, url)
 
             # --- Validation ---
             url_lower = url.lower()
@@ -197,9 +195,8 @@ class OleScraper(BaseScraper):
             is_article_type = False
             is_correct_section = section not in ['primera', 'ascenso']
 
-            for tag in soup.find_all("script", {"type": "application/ld+json"}):
+            for data in doc.json_ld:
                 try:
-                    data = json.loads(tag.string or "{}")
                     payloads = data if isinstance(data, list) else [data]
                     for obj in payloads:
                         if obj.get("@type") in ("Article", "NewsArticle"):
@@ -235,9 +232,9 @@ class OleScraper(BaseScraper):
                 return None
             
             # --- Parsing ---
-            metadata = self.parse_json_ld(html)
+            metadata = self.parse_json_ld(doc)
             if not metadata or not metadata.get('title'):
-                fallback = self.extract_fallback_metadata(html, url)
+                fallback = self.extract_fallback_metadata(doc, url)
                 metadata = {**fallback, **(metadata or {})}
 
             if not metadata or not metadata.get('title'):
@@ -252,7 +249,7 @@ class OleScraper(BaseScraper):
                 'author': metadata.get('author', '').strip(),
                 'date_published': normalize_date(metadata.get('date_published')),
                 'date_modified': normalize_date(metadata.get('date_modified')),
-                'fetched_at': datetime.utcnow(),
+                'fetched_at': datetime.now(timezone.utc),
                 'source': source, 'section': section, 'site': self.get_site_domain()
             }
             return article
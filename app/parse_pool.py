@@ -0,0 +1,165 @@
+"""
+Process pool for the CPU-bound part of scraping: turning HTML into links and
+article metadata.
+
+Fetching stays in the web/scheduler process, where it is I/O-bound and runs on
+the fetch engine threads. Parsing is shipped to PARSE_WORKERS worker processes,
+so BeautifulSoup/lxml work no longer holds the GIL of the process that serves
+the feed endpoints. Each worker keeps one scraper instance per scraper class
+(built with store=None) and calls the requested method on it. Parity checks of
+the lxml extractor made in a worker travel back with the result; this process
+keeps the stats and decides when a site's fast path is switched off.
+
+Submissions are bounded: at most PARSE_QUEUE_SIZE parse jobs are queued or
+running at any time and further callers block until a slot frees up, which
+slows the fetchers down instead of piling HTML up in memory.
+
+PARSE_WORKERS=0 parses inline, in the calling thread, as before.
+"""
+
+import atexit
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .fast_extractor import get_parity_monitor
+
+logger = logging.getLogger(__name__)
+
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", "2"))
+PARSE_QUEUE_SIZE = int(os.environ.get("PARSE_QUEUE_SIZE", str(max(PARSE_WORKERS, 1) * 4)))
+
+# Worker side: scraper instances of this process, keyed by class name
+_worker_scrapers = {}
+_in_worker = False
+
+
+def is_worker_process():
+    """True inside a parse worker (or any other multiprocessing child)."""
+    # The process name is set before a spawned child re-imports __main__, unlike parent_process()
+    return _in_worker or multiprocessing.current_process().name != 'MainProcess'
+
+
+def _worker_call(class_name, settings, method, args):
+    """
+    Runs scraper.<method>(*args) inside a worker process. Returns the result and
+    the worker's extractor parity report, which the parent applies.
+    """
+    global _in_worker
+    _in_worker = True  # never start a nested pool from a worker
+    monitor = get_parity_monitor()
+    monitor.report_only = True
+    scraper = _worker_scrapers.get(class_name)
+    if scraper is None:
+        from .scraper_factory import ScraperFactory
+        scraper = ScraperFactory.SCRAPER_CLASSES[class_name](None)
+        _worker_scrapers[class_name] = scraper
+    for name, value in settings.items():
+        setattr(scraper, name, value)
+    result = getattr(scraper, method)(*args)
+    return result, monitor.take_report()
+
+
+class ParsePool:
+    """Lazily started, bounded ProcessPoolExecutor (spawn context) for parse jobs."""
+
+    def __init__(self, workers=PARSE_WORKERS, queue_size=PARSE_QUEUE_SIZE):
+        self.workers = workers
+        self._slots = threading.BoundedSemaphore(max(queue_size, 1))
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.inline = 0
+
+    @property
+    def enabled(self):
+        return self.workers > 0
+
+    def _ensure_executor(self):
+        with self._lock:
+            # A forked child (e.g. a gunicorn worker) must not share its parent's pool
+            if self._executor is None or self._pid != os.getpid():
+                # spawn: workers never inherit sockets, locks or the scheduler thread of this process
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+                self._pid = os.getpid()
+                logger.info(f"Started parse pool with {self.workers} worker processes")
+            return self._executor
+
+    def _reset(self, executor):
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def run(self, class_name, settings, method, *args):
+        """
+        Runs a scraper method in a worker process and returns its result, blocking while
+        the queue is full. A broken pool is reset and BrokenProcessPool re-raised.
+        """
+        executor = self._ensure_executor()
+        self._slots.acquire()
+        try:
+            future = executor.submit(_worker_call, class_name, settings, method, args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self.submitted += 1
+        try:
+            result, parity_report = future.result()
+        except BrokenProcessPool:
+            logger.error("Parse pool worker died; restarting the pool")
+            self._reset(executor)
+            raise
+        if parity_report:
+            get_parity_monitor().apply_report(parity_report)
+        return result
+
+    def call(self, scraper, method, *args):
+        """
+        Runs scraper.<method>(*args) in the pool, or inline when the pool is disabled,
+        the scraper class cannot be rebuilt in a worker, or the pool just broke.
+        """
+        from .scraper_factory import ScraperFactory
+        class_name = type(scraper).__name__
+        if self.enabled and not is_worker_process() and ScraperFactory.SCRAPER_CLASSES.get(class_name) is type(scraper):
+            try:
+                return self.run(class_name, scraper.parse_settings(), method, *args)
+            except BrokenProcessPool:
+                pass
+        self.inline += 1
+        return getattr(scraper, method)(*args)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None and self._pid == os.getpid():
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self):
+        return {
+            'workers': self.workers,
+            'running': self._executor is not None,
+            'submitted': self.submitted,
+            'inline': self.inline,
+        }
+
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool():
+    """Returns the process-wide ParsePool, creating it on first use."""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ParsePool()
+            atexit.register(_parse_pool.shutdown)
+        return _parse_pool
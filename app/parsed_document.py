@@ -0,0 +1,80 @@
+"""
+Parsed representation of a fetched article page.
+
+A ParsedDocument is created once per fetch and handed to every step of the
+article pipeline (validation, JSON-LD extraction, meta tag fallback), so the
+page is parsed into a DOM at most once and its JSON-LD scripts are decoded at
+most once, no matter how many steps look at them.
+
+With extractor='lxml' the JSON-LD scripts and meta tags are read from the
+lxml tree instead (see fast_extractor); the soup is then only built if some
+step explicitly asks for it.
+"""
+
+import json
+import logging
+from functools import cached_property
+
+from bs4 import BeautifulSoup
+
+from . import fast_extractor
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedDocument:
+    """HTML of a page with a lazily built soup and cached JSON-LD payloads."""
+
+    def __init__(self, html, url=None, extractor='soup'):
+        self.html = html
+        self.url = url
+        self.extractor = extractor
+
+    @classmethod
+    def of(cls, html_or_doc, url=None):
+        """Wraps raw HTML in a ParsedDocument; existing documents are returned as is."""
+        if isinstance(html_or_doc, cls):
+            return html_or_doc
+        return cls(html_or_doc, url)
+
+    @cached_property
+    def soup(self):
+        return BeautifulSoup(self.html, 'lxml')
+
+    @cached_property
+    def tree(self):
+        """lxml document, or None if it could not be parsed"""
+        return fast_extractor.parse_tree(self.html)
+
+    @property
+    def uses_lxml(self):
+        return self.extractor == 'lxml' and self.tree is not None
+
+    @cached_property
+    def json_ld_scripts(self):
+        """Raw text of every <script type="application/ld+json"> in document order."""
+        if self.uses_lxml:
+            return fast_extractor.json_ld_scripts(self.tree)
+        scripts = []
+        for tag in self.soup.find_all('script', {'type': 'application/ld+json'}):
+            content = getattr(tag, 'string', None) or ''
+            if content and isinstance(content, str):
+                scripts.append(content)
+        return scripts
+
+    @cached_property
+    def json_ld(self):
+        """Decoded JSON-LD payloads; scripts that are not valid JSON are skipped."""
+        payloads = []
+        for content in self.json_ld_scripts:
+            try:
+                payloads.append(json.loads(content))
+            except json.JSONDecodeError as e:
+                logger.warning(f"Error parsing JSON-LD: {e}")
+        return payloads
+
+    def __len__(self):
+        return len(self.html) if self.html else 0
+
+    def __bool__(self):
+        return bool(self.html)
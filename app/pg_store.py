@@ -0,0 +1,367 @@
+"""
+PostgreSQL backend for the article store.
+
+Selected by ArticleStore when DATABASE_URL points at Postgres, so several
+hosts (or web workers) can share one database instead of a local SQLite file.
+Connections come from a ThreadedConnectionPool; PgConnection.close() hands the
+connection back to the pool, so callers use it exactly like the SQLite one.
+
+The functions here mirror the module-level functions of store.py, which
+dispatch to them when given a PgConnection. Timestamps are epoch milliseconds
+in BIGINT columns, as in SQLite, and the ?q= search uses a stored tsvector
+column with a GIN index.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+
+import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
+import psycopg2.pool
+
+logger = logging.getLogger(__name__)
+
+PG_POOL_MIN = int(os.environ.get("PG_POOL_MIN", "2"))    # idle connections kept open
+PG_POOL_MAX = int(os.environ.get("PG_POOL_MAX", "20"))   # per process
+
+
+def is_postgres_url(url):
+    return bool(url) and url.split(':', 1)[0] in ('postgres', 'postgresql')
+
+
+class PgConnection(psycopg2.extensions.connection):
+    """Pooled connection; close() returns it to its pool (rolling back any open transaction)."""
+
+    pool = None
+
+    def close(self):
+        pool, self.pool = self.pool, None
+        if pool is None or pool.closed:
+            return super().close()
+        pool.putconn(self)
+
+
+def open_pool(database_url):
+    return psycopg2.pool.ThreadedConnectionPool(
+        PG_POOL_MIN, PG_POOL_MAX, database_url, connection_factory=PgConnection
+    )
+
+
+def get_conn(pool):
+    conn = pool.getconn()
+    conn.pool = pool
+    return conn
+
+
+def _from_ms(ms):
+    if ms is None:
+        return None
+    return datetime.fromtimestamp(ms / 1000, timezone.utc)
+
+
+# --- Schema ---
+
+# Lower-cases and strips the accents used in pt/es/fr/de/it. Plain translate() keeps it
+# IMMUTABLE (usable in a generated column) and needs no unaccent extension on the server;
+# accented capitals are listed too because lower() leaves them alone under the C locale.
+_FOLD_FUNCTION = """
+    CREATE OR REPLACE FUNCTION rssprime_fold(value text) RETURNS text
+    LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+        SELECT translate(lower(value),
+                         'áàâãäåçéèêëíìîïñóòôõöøúùûüýÿÁÀÂÃÄÅÇÉÈÊËÍÌÎÏÑÓÒÔÕÖØÚÙÛÜÝ',
+                         'aaaaaaceeeeiiiinoooooouuuuyyaaaaaaceeeeiiiinoooooouuuuy')
+    $$
+"""
+
+_SCHEMA = [
+    _FOLD_FUNCTION,
+    """
+    CREATE TABLE IF NOT EXISTS articles (
+        id BIGSERIAL PRIMARY KEY, url TEXT NOT NULL, canonical_url TEXT,
+        source TEXT NOT NULL, section TEXT, title TEXT NOT NULL, description TEXT,
+        image TEXT, author TEXT, date_published TEXT, date_modified TEXT, scraped_at TEXT NOT NULL,
+        published_ms BIGINT, modified_ms BIGINT, scraped_ms BIGINT, sort_key BIGINT,
+        search tsvector GENERATED ALWAYS AS (
+            to_tsvector('simple', rssprime_fold(
+                coalesce(title, '') || ' ' || coalesce(description, '') || ' ' || coalesce(author, '')
+            ))
+        ) STORED
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ux_articles_source_section_canonical ON articles (source, section, canonical_url)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_canonical ON articles (canonical_url)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_source_section_sort ON articles (source, section, sort_key DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_source_sort ON articles (source, sort_key DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_sort ON articles (sort_key DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_articles_scraped ON articles (scraped_ms)",
+    # Competed with ix_articles_source_section_sort for feed queries (see store._migration_7_feed_order_indexes)
+    "DROP INDEX IF EXISTS ix_articles_source_section_scraped",
+    "CREATE INDEX IF NOT EXISTS ix_articles_search ON articles USING GIN (search)",
+    """
+    CREATE TABLE IF NOT EXISTS feeds (
+        source TEXT NOT NULL, path TEXT NOT NULL, display_name TEXT, last_refreshed_at TEXT,
+        last_refreshed_ms BIGINT, last_found_count INTEGER DEFAULT 0, last_added_count INTEGER DEFAULT 0,
+        PRIMARY KEY (source, path)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS processed_topics (
+        topic_name TEXT PRIMARY KEY, json_data TEXT NOT NULL, updated_at TEXT NOT NULL
+    )
+    """,
+    # Compressed topic JSON (see store.save_processed_topic)
+    "ALTER TABLE processed_topics ADD COLUMN IF NOT EXISTS payload BYTEA",
+    """
+    CREATE TABLE IF NOT EXISTS feed_versions (
+        source TEXT NOT NULL, section TEXT NOT NULL, version BIGINT NOT NULL DEFAULT 0,
+        PRIMARY KEY (source, section)
+    )
+    """,
+]
+
+
+def init_db(conn):
+    with conn.cursor() as cursor:
+        # Several workers may start at once; DDL is serialized by an advisory lock
+        cursor.execute("SELECT pg_advisory_xact_lock(hashtext('rssprime_schema'))")
+        for statement in _SCHEMA:
+            cursor.execute(statement)
+    conn.commit()
+    logger.info("PostgreSQL tables initialized successfully.")
+
+
+def add_feeds(conn, rows):
+    """rows: (source, path, display_name); existing feeds are left untouched."""
+    with conn.cursor() as cursor:
+        psycopg2.extras.execute_values(
+            cursor,
+            "INSERT INTO feeds (source, path, display_name) VALUES %s ON CONFLICT (source, path) DO NOTHING",
+            rows,
+        )
+    conn.commit()
+
+
+def delete_matching_urls(conn, source, patterns):
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM articles WHERE source = %s AND url LIKE ANY(%s)",
+            (source, [f'%{p}%' for p in patterns]),
+        )
+        deleted_count = cursor.rowcount
+    conn.commit()
+    return deleted_count
+
+
+# --- Articles ---
+
+_INSERT_ARTICLE_SQL = """
+    INSERT INTO articles
+    (url, canonical_url, source, section, title, description, image, author, date_published, date_modified, scraped_at,
+     published_ms, modified_ms, scraped_ms, sort_key)
+    VALUES %s
+    ON CONFLICT (source, section, canonical_url) DO NOTHING
+    RETURNING source, section, canonical_url
+"""
+
+
+def get_stats(conn):
+    with conn.cursor() as cursor:
+        cursor.execute('SELECT COUNT(*), MAX(scraped_ms) FROM articles')
+        total_articles, last_ms = cursor.fetchone()
+    conn.rollback()
+    last_update = _from_ms(last_ms)
+    return {'total_articles': total_articles, 'last_update': last_update.isoformat() if last_update else None}
+
+
+def known_urls(conn, canonical_urls, source=None, section=None):
+    """Canonical URLs (of the given ones) already stored, optionally within source/section."""
+    query = "SELECT DISTINCT canonical_url FROM articles WHERE canonical_url = ANY(%s)"
+    params = [list(canonical_urls)]
+    if source is not None:
+        query += " AND source = %s"
+        params.append(source)
+    if section is not None:
+        query += " AND section = %s"
+        params.append(section)
+    with conn.cursor() as cursor:
+        cursor.execute(query, params)
+        return {row[0] for row in cursor.fetchall()}
+
+
+def insert_rows(conn, rows):
+    """
+    Inserts article rows (store._article_row tuples) in one statement and returns the
+    (source, section, canonical_url) keys that were actually inserted.
+    """
+    if not rows:
+        return set()
+    with conn.cursor() as cursor:
+        inserted = {tuple(row) for row in psycopg2.extras.execute_values(
+            cursor, _INSERT_ARTICLE_SQL, rows, page_size=len(rows), fetch=True)}
+        bump_feed_versions(cursor, {key[:2] for key in inserted})
+    conn.commit()
+    return inserted
+
+
+def bump_feed_versions(cursor, keys):
+    """Bumps the (source, section) content versions; sorted so concurrent writers lock rows in the same order."""
+    keys = sorted(keys)
+    if keys:
+        psycopg2.extras.execute_values(cursor, """
+            INSERT INTO feed_versions (source, section, version) VALUES %s
+            ON CONFLICT (source, section) DO UPDATE SET version = feed_versions.version + 1
+        """, keys, template="(%s, %s, 1)")
+
+
+def get_feed_versions(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT source, section, version FROM feed_versions")
+        rows = cursor.fetchall()
+    conn.rollback()
+    return rows
+
+
+def _search_is_common(conn, tsquery, common_matches):
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "SELECT count(*) FROM (SELECT 1 FROM articles WHERE search @@ to_tsquery('simple', rssprime_fold(%s)) LIMIT %s) m",
+            (tsquery, common_matches),
+        )
+        return cursor.fetchone()[0] >= common_matches
+
+
+def get_recent_articles(conn, cutoff_ms, limit, query_filter=None, source=None, section=None, exclude_authors=None,
+                        common_matches=1000):
+    where_conditions = ["scraped_ms >= %s"]
+    params = [cutoff_ms]
+    if source:
+        where_conditions.append("source = %s")
+        params.append(source)
+    if section:
+        where_conditions.append("section = %s")
+        params.append(section)
+    if exclude_authors:
+        where_conditions.append("(author IS NULL OR NOT (author = ANY(%s)))")
+        params.append(list(exclude_authors))
+    if query_filter:
+        if query_filter.get('tsquery'):
+            where_conditions.append("search @@ to_tsquery('simple', rssprime_fold(%s))")
+            params.append(query_filter['tsquery'])
+        if query_filter.get('tsquery_exclude'):
+            where_conditions.append("NOT (search @@ to_tsquery('simple', rssprime_fold(%s)))")
+            params.append(query_filter['tsquery_exclude'])
+    query = f"""
+        SELECT url, source, section, title, description, image, author, published_ms, modified_ms, scraped_ms
+        FROM articles
+        WHERE {' AND '.join(where_conditions)}
+        ORDER BY sort_key DESC
+        LIMIT %s
+    """
+    if query_filter and query_filter.get('tsquery') and not _search_is_common(conn, query_filter['tsquery'], common_matches):
+        # The planner tends to walk the sort index and filter, which reads the whole window
+        # for a rare term; collect the (few) matches through the GIN index first instead.
+        query = f"""
+            WITH matches AS MATERIALIZED (
+                SELECT url, source, section, title, description, image, author, published_ms, modified_ms, scraped_ms, sort_key
+                FROM articles
+                WHERE {' AND '.join(where_conditions)}
+            )
+            SELECT url, source, section, title, description, image, author, published_ms, modified_ms, scraped_ms
+            FROM matches
+            ORDER BY sort_key DESC
+            LIMIT %s
+        """
+    params.append(limit)
+    with conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor) as cursor:
+        cursor.execute(query, params)
+        rows = cursor.fetchall()
+    conn.rollback()  # end the read transaction; the pooled connection stays idle
+    articles = []
+    for row in rows:
+        article = dict(row)
+        article['date_published'] = _from_ms(article.pop('published_ms'))
+        article['date_modified'] = _from_ms(article.pop('modified_ms'))
+        article['fetched_at'] = _from_ms(article.pop('scraped_ms'))
+        articles.append(article)
+    return articles
+
+
+def retention_bounds(conn, cutoff_ms):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT MIN(id), MAX(id) FROM articles WHERE scraped_ms < %s", (cutoff_ms,))
+        bounds = cursor.fetchone()
+    conn.rollback()
+    return bounds
+
+
+def delete_scraped_range(conn, low, high, cutoff_ms):
+    with conn.cursor() as cursor:
+        cursor.execute(
+            "DELETE FROM articles WHERE id >= %s AND id < %s AND scraped_ms < %s", (low, high, cutoff_ms)
+        )
+        deleted_count = cursor.rowcount
+    conn.commit()
+    return deleted_count
+
+
+def get_last_update_for_section(conn, source, section):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT MAX(scraped_ms) FROM articles WHERE source = %s AND section = %s", (source, section))
+        last_ms = cursor.fetchone()[0]
+    conn.rollback()
+    return _from_ms(last_ms)
+
+
+# --- Feeds and processed topics ---
+
+def update_feed_stats(conn, source, path, refreshed_at, refreshed_ms, found, added):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            INSERT INTO feeds (source, path, display_name, last_refreshed_at, last_refreshed_ms, last_found_count, last_added_count)
+            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            ON CONFLICT (source, path) DO UPDATE
+               SET last_refreshed_at = EXCLUDED.last_refreshed_at,
+                   last_refreshed_ms = EXCLUDED.last_refreshed_ms,
+                   last_found_count  = EXCLUDED.last_found_count,
+                   last_added_count  = EXCLUDED.last_added_count
+        """, (source, path, f"{source}/{path}", refreshed_at, refreshed_ms, found, added))
+    conn.commit()
+
+
+def get_feed_rows(conn):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT source, path, display_name, last_refreshed_ms, last_found_count, last_added_count FROM feeds ORDER BY display_name ASC")
+        rows = cursor.fetchall()
+    conn.rollback()
+    return rows
+
+
+def save_processed_topic(conn, topic_name, payload, updated_at, version_source):
+    with conn.cursor() as cursor:
+        cursor.execute("""
+            INSERT INTO processed_topics (topic_name, json_data, updated_at, payload)
+            VALUES (%s, '', %s, %s)
+            ON CONFLICT (topic_name) DO UPDATE
+               SET json_data = '', updated_at = EXCLUDED.updated_at, payload = EXCLUDED.payload
+        """, (topic_name, updated_at, psycopg2.Binary(payload)))
+        bump_feed_versions(cursor, [(version_source, topic_name)])
+    conn.commit()
+
+
+def get_topic_version(conn, topic_name):
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT updated_at FROM processed_topics WHERE topic_name = %s", (topic_name,))
+        row = cursor.fetchone()
+    conn.rollback()
+    return row[0] if row else None
+
+
+def get_topic_payload(conn, topic_name):
+    """(updated_at, payload, json_data); payload is NULL for rows stored before compaction."""
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT updated_at, payload, json_data FROM processed_topics WHERE topic_name = %s", (topic_name,))
+        row = cursor.fetchone()
+    conn.rollback()
+    return row
@@ -0,0 +1,151 @@
+"""
+Per-host token-bucket rate limiting for all scraper requests.
+
+Every request made through BaseScraper._send takes a token from the bucket of
+its host. Each bucket refills at `rate` tokens per second up to `burst` tokens,
+so a host is only ever slowed down by its own traffic: requests to
+g1.globo.com never wait on the budget of marca.com.
+
+Rates are configured per source with a 'rate_limit' entry in SOURCES_CONFIG,
+e.g. {'rate': 1.0, 'burst': 2}; hosts without one use RATE_LIMIT_RATE and
+RATE_LIMIT_BURST.
+
+Calls run by the fetch engine reserve their token in the event loop before
+they take a global slot (see FetchEngine.run_one), so a throttled host never
+keeps slots asleep. The first request such a call makes uses that prepaid
+token; any further ones (retries, fallbacks) wait for their own.
+"""
+
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = float(os.environ.get("RATE_LIMIT_RATE", "2.0"))  # requests per second
+DEFAULT_BURST = int(os.environ.get("RATE_LIMIT_BURST", "5"))
+
+
+class TokenBucket:
+    """Thread-safe token bucket. Callers reserve a token and sleep until it is due."""
+
+    def __init__(self, rate, burst):
+        self.rate = max(float(rate), 0.001)
+        self.burst = max(int(burst), 1)
+        self.tokens = float(self.burst)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Takes a token and returns how many seconds the caller must wait before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            # The bucket goes negative: later callers queue up behind this reservation
+            return -self.tokens / self.rate
+
+    def acquire(self):
+        """Blocks until a token is available. Returns the time spent waiting."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """Registry of token buckets keyed by host name."""
+
+    def __init__(self, default_rate=DEFAULT_RATE, default_burst=DEFAULT_BURST):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._waited = {}
+        self._local = threading.local()
+
+    def configure(self, host, rate, burst):
+        """Sets the rate and burst for a host, replacing any existing bucket."""
+        with self._lock:
+            self._buckets[host.lower()] = TokenBucket(rate, burst)
+
+    def configure_source(self, source_config):
+        """Applies the source's 'rate_limit' (if any) to every host it is scraped from."""
+        limits = source_config.get('rate_limit')
+        if not limits:
+            return
+        urls = [source_config.get('base_url'), source_config.get('official_rss')]
+        for section in source_config.get('sections', {}).values():
+            urls.extend(section.get('start_urls', []))
+            urls.append(section.get('official_rss'))
+        hosts = {urlparse(u).netloc for u in urls if u}
+        for host in hosts:
+            self.configure(host, limits.get('rate', self.default_rate), limits.get('burst', self.default_burst))
+        logger.debug(f"Rate limit {limits} applied to {sorted(hosts)}")
+
+    def _bucket(self, host):
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.default_rate, self.default_burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _record_wait(self, host, waited):
+        logger.debug(f"Rate limited {host} for {waited:.2f}s")
+        with self._lock:
+            self._waited[host] = self._waited.get(host, 0.0) + waited
+
+    def reserve(self, url):
+        """Takes a token for the host of url and returns how long to wait before using it."""
+        host = urlparse(url).netloc.lower()
+        wait = self._bucket(host).reserve()
+        if wait > 0:
+            self._record_wait(host, wait)
+        return wait
+
+    def run_prepaid(self, url, func, *args, **kwargs):
+        """
+        Calls func(*args, **kwargs) with a token for the host of url already reserved
+        (see reserve): the first acquire for that host in this call does not wait.
+        """
+        host = urlparse(url).netloc.lower()
+        self._local.prepaid = host
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._local.prepaid = None
+
+    def acquire(self, url):
+        """Waits for the host of url to have budget for one more request."""
+        host = urlparse(url).netloc.lower()
+        if getattr(self._local, 'prepaid', None) == host:
+            self._local.prepaid = None
+            return 0.0
+        waited = self._bucket(host).acquire()
+        if waited > 0:
+            self._record_wait(host, waited)
+        return waited
+
+    def stats(self):
+        """Seconds spent waiting per host since the process started."""
+        with self._lock:
+            return {host: round(seconds, 2) for host, seconds in self._waited.items()}
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter():
+    """Returns the process-wide HostRateLimiter, creating it on first use."""
+    global _rate_limiter
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = HostRateLimiter()
+        return _rate_limiter
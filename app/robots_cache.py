@@ -0,0 +1,189 @@
+"""
+Process-wide robots.txt cache shared by all scrapers.
+
+Entries are kept per host for ROBOTS_TTL seconds and persisted to
+data/robots_cache.json, so a restart (or the other gunicorn worker) starts
+warm. robots.txt is downloaded with a bounded timeout; an expired entry keeps
+answering while a background thread refreshes it, so only the very first
+lookup for an unknown host ever waits on the network.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+import requests
+
+from .utils import get_user_agent
+
+logger = logging.getLogger(__name__)
+
+ROBOTS_CACHE_PATH = os.environ.get("ROBOTS_CACHE_PATH", os.path.join("data", "robots_cache.json"))
+ROBOTS_TTL = int(os.environ.get("ROBOTS_TTL", str(24 * 3600)))  # seconds
+ROBOTS_TIMEOUT = float(os.environ.get("ROBOTS_TIMEOUT", "5"))  # seconds
+# Off by default, as before the cache existed: disallowed URLs are only logged
+ROBOTS_ENFORCE = os.environ.get("ROBOTS_ENFORCE", "false").lower() in ("true", "1", "t")
+
+# Entry states, mirroring how RobotFileParser.read() treats HTTP statuses
+ALLOW_ALL = "allow_all"        # 404 and other 4xx, or robots.txt unreachable
+DISALLOW_ALL = "disallow_all"  # 401 / 403
+RULES = "rules"                # 200 with a body to parse
+
+
+class RobotsCache:
+    """TTL-bound robots.txt cache with disk persistence and background refresh."""
+
+    def __init__(self, path=ROBOTS_CACHE_PATH, ttl=ROBOTS_TTL, timeout=ROBOTS_TIMEOUT):
+        self.path = path
+        self.ttl = ttl
+        self.timeout = timeout
+        self._entries = {}   # host -> {'state', 'lines', 'fetched_at'}
+        self._parsers = {}   # host -> RobotFileParser, built lazily from 'lines'
+        self._refreshing = set()
+        self._host_locks = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+            logger.info(f"Loaded robots.txt cache for {len(self._entries)} hosts from {self.path}")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Could not load robots.txt cache from {self.path}: {e}")
+
+    def _save(self):
+        with self._lock:
+            snapshot = dict(self._entries)
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"Could not persist robots.txt cache: {e}")
+
+    def _download(self, host):
+        """Fetches robots.txt for host and returns a cache entry."""
+        from .rate_limiter import get_rate_limiter
+        robots_url = f"https://{host}/robots.txt"
+        try:
+            get_rate_limiter().acquire(robots_url)
+            response = requests.get(robots_url, timeout=self.timeout, headers={'User-Agent': get_user_agent()})
+            if response.status_code in (401, 403):
+                state, lines = DISALLOW_ALL, []
+            elif 400 <= response.status_code < 500:
+                state, lines = ALLOW_ALL, []
+            elif response.status_code >= 500:
+                raise requests.HTTPError(f"HTTP {response.status_code}")
+            else:
+                state, lines = RULES, response.text.splitlines()
+        except Exception as e:
+            logger.warning(f"Could not read robots.txt for {host}: {e}")
+            return None
+        return {'state': state, 'lines': lines, 'fetched_at': time.time()}
+
+    def refresh(self, host):
+        """Downloads robots.txt for host now and stores the result."""
+        entry = self._download(host)
+        with self._lock:
+            self._refreshing.discard(host)
+            if entry is None:
+                if host in self._entries:
+                    # Keep serving the previous rules; try again after another TTL
+                    self._entries[host]['fetched_at'] = time.time()
+                    return
+                # Unreachable robots.txt: assume we can fetch, retry after the TTL
+                entry = {'state': ALLOW_ALL, 'lines': [], 'fetched_at': time.time()}
+            self._entries[host] = entry
+            self._parsers.pop(host, None)
+        self._save()
+
+    def _refresh_in_background(self, host):
+        with self._lock:
+            if host in self._refreshing:
+                return
+            self._refreshing.add(host)
+        threading.Thread(target=self.refresh, args=(host,), name=f"robots-{host}", daemon=True).start()
+
+    def warm(self, hosts):
+        """Refreshes, in the background, every host that is missing or expired."""
+        now = time.time()
+        for host in hosts:
+            entry = self._entries.get(host)
+            if not entry or now - entry['fetched_at'] > self.ttl:
+                self._refresh_in_background(host)
+
+    def _parser(self, host):
+        with self._lock:
+            parser = self._parsers.get(host)
+            if parser is None:
+                parser = RobotFileParser()
+                parser.parse(self._entries[host]['lines'])
+                self._parsers[host] = parser
+            return parser
+
+    def can_fetch(self, url, user_agent):
+        """Returns whether robots.txt allows user_agent to fetch url."""
+        host = urlparse(url).netloc
+        entry = self._entries.get(host)
+        if entry is None:
+            # First sighting of this host: the only lookup that waits (bounded by the timeout).
+            # Concurrent callers wait for the same download instead of starting their own.
+            with self._lock:
+                host_lock = self._host_locks.setdefault(host, threading.Lock())
+            with host_lock:
+                if host not in self._entries:
+                    self.refresh(host)
+            entry = self._entries[host]
+        elif time.time() - entry['fetched_at'] > self.ttl:
+            self._refresh_in_background(host)
+
+        if entry['state'] == ALLOW_ALL:
+            return True
+        if entry['state'] == DISALLOW_ALL:
+            return False
+        return self._parser(host).can_fetch(user_agent, url)
+
+    def stats(self):
+        """Number of cached hosts, how many are expired and how many are being refreshed."""
+        now = time.time()
+        return {
+            'hosts': len(self._entries),
+            'expired': sum(1 for e in self._entries.values() if now - e['fetched_at'] > self.ttl),
+            'refreshing': len(self._refreshing),
+        }
+
+
+_robots_cache = None
+_robots_cache_lock = threading.Lock()
+
+
+def get_robots_cache():
+    """Returns the process-wide RobotsCache, creating it on first use."""
+    global _robots_cache
+    with _robots_cache_lock:
+        if _robots_cache is None:
+            _robots_cache = RobotsCache()
+        return _robots_cache
+
+
+def warm_robots_cache(sources_config):
+    """Warms the robots.txt cache for every host configured in SOURCES_CONFIG."""
+    urls = []
+    for source in sources_config.values():
+        urls.extend([source.get('base_url'), source.get('official_rss')])
+        for section in source.get('sections', {}).values():
+            urls.extend(section.get('start_urls', []))
+            urls.append(section.get('official_rss'))
+    hosts = {urlparse(u).netloc for u in urls if u}
+    get_robots_cache().warm(sorted(hosts))
@@ -1,7 +1,7 @@
 import logging
+import os
 import threading
-import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
@@ -12,6 +12,11 @@ from .scraper_factory import ScraperFactory
 
 logger = logging.getLogger(__name__)
 
+# How many source/sections of a topic are scraped at the same time
+SCRAPE_WORKERS = int(os.environ.get("SCHEDULER_SCRAPE_WORKERS", "4"))
+# How often expired articles are purged (see store.run_retention)
+RETENTION_INTERVAL_HOURS = float(os.environ.get("RETENTION_INTERVAL_HOURS", "6"))
+
 # Definition of topics, their sources, and processing rules as per the prompt
 TOPIC_DEFINITIONS = {
     "esportes_nacionais": {
@@ -65,6 +70,7 @@ class FeedScheduler:
         self.scheduler = BackgroundScheduler()
         self.is_running_flag = False
         self.last_run = None
+        self.last_retention = None
         self.lock = threading.Lock()
 
     def start(self):
@@ -78,6 +84,14 @@ class FeedScheduler:
                 replace_existing=True,
                 max_instances=1
             )
+            self.scheduler.add_job(
+                func=self._retention_job,
+                trigger=IntervalTrigger(hours=RETENTION_INTERVAL_HOURS),
+                id='retention',
+                name='Article Retention Job',
+                replace_existing=True,
+                max_instances=1
+            )
             self.scheduler.start()
             logger.info(f"Scheduler started - refresh every {self.refresh_interval_minutes} minutes")
 
@@ -128,21 +142,16 @@ class FeedScheduler:
                     "max_items": 100
                 }
 
+                # Sections of different sources hit different hosts, so they are scraped
+                # in parallel; the per-host rate limiter keeps each site's pace polite.
+                jobs = [(source, section) for source, sections in definition["sources"].items() for section in sections]
+                with ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, thread_name_prefix="topic-scrape") as pool:
+                    results = dict(zip(jobs, pool.map(lambda job: self._scrape_section(topic, *job), jobs)))
+
                 for source, sections in definition["sources"].items():
                     source_items = []
                     for section in sections:
-                        try:
-                            logger.info(f"Scraping {source}/{section} for topic {topic}")
-                            # We no longer save to store here, just get the articles
-                            new_articles, _ = ScraperFactory.scrape_source_section(
-                                source, section, self.store, 
-                                max_pages=1, max_articles=100, request_delay=0.5, save_to_db=False
-                            )
-                            source_items.extend(new_articles)
-                            time.sleep(1) # Be nice to servers
-                        except Exception as e:
-                            logger.error(f"Error scraping {source}/{section}: {e}")
-                            continue
+                        source_items.extend(results[(source, section)])
                     
                     if source_items:
                         # The processor expects a specific format for items
@@ -167,13 +176,13 @@ class FeedScheduler:
                 # Process the collected data for the topic
                 processed_data = feed_processor.process_feed_data(input_data_for_processor)
 
-                # Save the final processed JSON to the database
+                # Save the final processed topic to the database (stored compressed)
                 conn = self.store.get_conn()
                 try:
                     store_module.save_processed_topic(
                         conn,
                         topic,
-                        json.dumps(processed_data, indent=2),
+                        processed_data,
                         processed_data['updated_at']
                     )
                 finally:
@@ -189,6 +198,34 @@ class FeedScheduler:
             with self.lock:
                 self.is_running_flag = False
 
+    def _retention_job(self):
+        """Deletes expired and invalid articles in small batches and reclaims their space."""
+        conn = self.store.get_conn()
+        try:
+            report = store_module.run_retention(conn)
+        finally:
+            conn.close()
+        report['finished_at'] = datetime.now(timezone.utc).isoformat()
+        self.last_retention = report
+        logger.info(
+            f"Retention: {report['deleted']} expired and {report['invalid_deleted']} invalid articles deleted "
+            f"in {report['batches']} batches, {report['bytes_reclaimed'] or 0} bytes reclaimed "
+            f"({report['duration_seconds']}s)"
+        )
+
+    def _scrape_section(self, topic, source, section):
+        """Scrapes one source/section for a topic without saving to the store."""
+        try:
+            logger.info(f"Scraping {source}/{section} for topic {topic}")
+            new_articles, _ = ScraperFactory.scrape_source_section(
+                source, section, self.store,
+                max_pages=1, max_articles=100, save_to_db=False
+            )
+            return new_articles
+        except Exception as e:
+            logger.error(f"Error scraping {source}/{section}: {e}")
+            return []
+
     def trigger_refresh(self):
         """Manually trigger a refresh."""
         try:
@@ -210,7 +247,8 @@ class FeedScheduler:
             'refresh_interval_minutes': self.refresh_interval_minutes,
             'last_run': self.last_run.isoformat() if self.last_run else None,
             'is_job_running': self.is_running_flag,
-            'next_run': self._get_next_run_time()
+            'next_run': self._get_next_run_time(),
+            'last_retention': self.last_retention
         }
 
     def _get_next_run_time(self):
@@ -5,7 +5,6 @@ Factory for creating scrapers for different news sources.
 from __future__ import annotations
 
 import logging
-import time
 from typing import Dict, List, Type, Any, Tuple
 
 # --- Scrapers locais ---
@@ -30,6 +29,9 @@ from .foxsports_scraper import FoxSportsScraper
 from .cbssports_scraper import CBSSportsScraper
 
 from .sources_config import SOURCES_CONFIG
+from .http_cache import DEFAULT_CACHE_TTL
+from .base_scraper import KNOWN_URL_THRESHOLD
+from .rate_limiter import get_rate_limiter
 from .scheduler_locks import acquire_lock, release_lock
 
 logger = logging.getLogger(__name__)
@@ -94,6 +96,16 @@ class ScraperFactory:
 
         # cria e cacheia
         scraper = scraper_class(store, request_delay=request_delay)
+        # TTL do cache de respostas (segundos), configurável por fonte
+        scraper.cache_ttl = source_config.get("cache_ttl", DEFAULT_CACHE_TTL)
+        # baixa só o <head> dos artigos (streaming), configurável por fonte
+        scraper.head_only = source_config.get("head_only", False)
+        # extrator de metadados: 'soup' (BeautifulSoup) ou 'lxml' (caminho rápido)
+        scraper.extractor = source_config.get("extractor", "soup")
+        # fração de links já conhecidos que encerra a paginação (None desativa)
+        scraper.known_url_threshold = source_config.get("known_url_threshold", KNOWN_URL_THRESHOLD)
+        # limite de requisições por host (token bucket), configurável por fonte
+        get_rate_limiter().configure_source(source_config)
         cls._scrapers[source] = scraper
         logger.info(f"Created {scraper_class_name} for source '{source}'")
         return scraper
@@ -131,6 +143,11 @@ class ScraperFactory:
         - Respects the section's start_urls.
         - Deduplicates URLs.
         - Limits the number of articles.
+        - Fetches and parses the articles concurrently via the shared fetch engine.
+        - Paces requests with the per-host rate limiter (request_delay is only
+          kept for compatibility and no longer sleeps).
+        - Sources with 'ingest': 'rss' build articles straight from their official
+          RSS feed items, fetching an article page only when a field is missing.
         - Applies filters defined in SOURCES_CONFIG.
         - Conditionally saves to the database based on save_to_db.
 
@@ -161,20 +178,43 @@ class ScraperFactory:
             official_rss_url = section_config.get("official_rss")
             start_urls = [official_rss_url] if official_rss_url else section_config.get("start_urls", [])
 
-            if not start_urls:
+            # Ingestão RSS: o artigo vem do próprio item do feed (1 requisição por seção)
+            feed_url = None
+            if source_config.get("ingest") == "rss":
+                feed_url = official_rss_url or source_config.get("official_rss")
+
+            if not start_urls and not feed_url:
                 logger.warning(f"No start_urls or official_rss configured for {source}/{section}")
                 return [], 0
 
             filters = section_config.get("filters", {}) or {}
 
             all_article_urls: List[str] = []
-            for start_url in start_urls:
-                logger.info(f"Listing pages for {source}/{section} from {start_url} (max_pages={max_pages})")
+            feed_items: Dict[str, dict] = {}
+            if feed_url:
+                logger.info(f"Reading feed for {source}/{section} from {feed_url}")
                 try:
-                    urls = scraper.list_pages(start_url, max_pages, section=section) or []
-                    all_article_urls.extend(urls)
+                    for item in scraper.read_feed(feed_url, section=section):
+                        feed_items.setdefault(item["link"], item)
+                    all_article_urls.extend(feed_items)
                 except Exception as e:
-                    logger.error(f"Failed listing pages from {start_url}: {e}")
+                    logger.error(f"Failed reading feed {feed_url}: {e}")
+            if feed_url and not feed_items:
+                # Feed vazio/indisponível: só as páginas HTML da seção, nunca o próprio feed
+                start_urls = [u for u in section_config.get("start_urls", []) if u != feed_url]
+                if not start_urls:
+                    logger.warning(f"Feed {feed_url} gave no items and {source}/{section} has no start_urls")
+            if not feed_items:
+                # Sem ingestão RSS (ou feed vazio/indisponível): listagem + página de cada artigo
+                for start_url in start_urls:
+                    logger.info(f"Listing pages for {source}/{section} from {start_url} (max_pages={max_pages})")
+                    try:
+                        # Only worth stopping early when known articles are skipped anyway
+                        urls = scraper.list_pages(start_url, max_pages, section=section, source=source,
+                                                  stop_on_known=save_to_db) or []
+                        all_article_urls.extend(urls)
+                    except Exception as e:
+                        logger.error(f"Failed listing pages from {start_url}: {e}")
 
             seen = set()
             deduped_urls = [u for u in all_article_urls if not (u in seen or seen.add(u))]
@@ -186,15 +226,25 @@ class ScraperFactory:
             scraped_articles: List[dict] = []
             conn = store.get_conn()
             try:
-                for i, article_url in enumerate(limited_urls, 1):
+                known = store_module.known_urls(conn, limited_urls, source, section) if save_to_db else set()
+                if known:
+                    logger.debug(f"{len(known)} articles already in store, skipping parsing")
+                pending_urls: List[str] = [u for u in limited_urls if u not in known]
+
+                if feed_items:
+                    # Feed items already carry the metadata; pages are fetched only to fill gaps
+                    parsed_articles = scraper.complete_feed_articles(
+                        [scraper.feed_item_to_article(feed_items[u], source, section) for u in pending_urls],
+                        source=source, section=section,
+                    )
+                else:
+                    # Articles are fetched and parsed concurrently; the fetch engine
+                    # bounds how many requests are in flight per host and overall.
+                    logger.info(f"Parsing {len(pending_urls)} articles for {source}/{section} concurrently")
+                    parsed_articles = scraper.parse_articles(pending_urls, source=source, section=section)
+
+                for article_url, article in zip(pending_urls, parsed_articles):
                     try:
-                        logger.info(f"[{i}/{len(limited_urls)}] Parsing: {article_url}")
-
-                        if save_to_db and store_module.has_article(conn, article_url):
-                            logger.debug(f"Article already exists in store, skipping parsing: {article_url}")
-                            continue
-                        
-                        article = scraper.parse_article(article_url, source=source, section=section)
                         if not article:
                             continue
 
@@ -205,23 +255,20 @@ class ScraperFactory:
                         
                         scraped_articles.append(article)
 
-                        if save_to_db:
-                            if store_module.upsert_article(conn, article):
-                                logger.info(f"Stored: {article.get('title')}")
-
-                        if i < len(limited_urls) and request_delay > 0:
-                            time.sleep(request_delay)
-
                     except Exception as e:
                         logger.error(f"Error processing article {article_url}: {e}", exc_info=True)
                         continue
+
+                if save_to_db:
+                    # One transaction for the whole section; only rows that were really inserted come back
+                    scraped_articles = store_module.upsert_many(conn, scraped_articles)
+                    for article in scraped_articles:
+                        logger.info(f"Stored: {article.get('title')}")
             finally:
                 conn.close()
 
-            # If saving to DB, we should return only the *newly* added ones.
-            # If not saving, we return all scraped articles.
-            # The current logic for `new_articles` in the old implementation was flawed because it was populated inside the loop.
-            # The correct list to return is `scraped_articles` which contains all successfully parsed articles.
+            # When saving to DB these are only the *newly* added articles;
+            # otherwise all successfully parsed (and not filtered) articles.
             return scraped_articles, total_links_found
 
         except Exception as e:
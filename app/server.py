@@ -12,6 +12,13 @@ from .utils import validate_admin_key, parse_query_filter
 from .sources_config import SOURCES_CONFIG as SOURCES
 from .dashboard_service import get_dashboard_data_safe
 from .scraper_factory import ScraperFactory
+from .http_cache import get_response_cache
+from .rate_limiter import get_rate_limiter
+from .robots_cache import get_robots_cache, warm_robots_cache
+from .base_scraper import get_head_fetch_stats, get_pagination_stats
+from .fast_extractor import get_parity_monitor
+from .parse_pool import get_parse_pool, is_worker_process
+from .render_cache import RenderedFeed, content_validators, get_render_cache
 
 class JsonFormatter(logging.Formatter):
     """Formats log records as a JSON string for NDJSON."""
@@ -70,17 +77,30 @@ MAX_PAGES = int(os.environ.get("MAX_PAGES", "3"))
 DEFAULT_LIMIT = int(os.environ.get("DEFAULT_LIMIT", "30"))
 REQUEST_DELAY_MS = int(os.environ.get("REQUEST_DELAY_MS", "900"))
 ADMIN_KEY = os.environ.get("ADMIN_KEY") # Can be None
+# XML writer per endpoint: 'stream' (app/feed_writer.py, byte-compatible) or 'feedgen'.
+# Sources can override FEED_WRITER with 'feed_writer' in SOURCES_CONFIG.
+FEED_WRITER = os.environ.get("FEED_WRITER", "stream")
+TOPIC_FEED_WRITER = os.environ.get("TOPIC_FEED_WRITER", FEED_WRITER)
 if not ADMIN_KEY:
     logger.warning("ADMIN_KEY environment variable not set. Admin endpoints will be inaccessible.")
 
 # Initialize components
-store = store_module.ArticleStore()
-
 feed_generator = FeedGenerator()
-scheduler = FeedScheduler(store, refresh_interval_minutes=30)
+store = None
+scheduler = None
+
+# Parse workers are spawned processes that re-import __main__ when the app runs via
+# `python main.py`; only the serving process opens the store (migrations, Bloom
+# filter), runs the scheduler and warms caches.
+if not is_worker_process():
+    store = store_module.get_store()
+    scheduler = FeedScheduler(store, refresh_interval_minutes=30)
 
-# Start background scheduler
-scheduler.start()
+    # Start background scheduler
+    scheduler.start()
+
+    # Load robots.txt rules from disk and refresh missing/expired hosts in the background
+    warm_robots_cache(SOURCES)
 
 def get_db():
     """Opens a new database connection if there is none yet for the current application context."""
@@ -88,6 +108,24 @@ def get_db():
         g.db = store.get_conn()
     return g.db
 
+def feed_response(rendered):
+    """
+    Builds the HTTP response for a (possibly cached) rendered feed: picks the
+    precompressed variant allowed by Accept-Encoding and answers
+    If-None-Match / If-Modified-Since with 304 when the client copy is current.
+    """
+    encoding, body, etag = rendered.select(request.accept_encodings)
+    response = Response(body, mimetype=rendered.content_type)
+    response.headers['Cache-Control'] = 'public, max-age=900'  # 15 minutes cache
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    if etag:
+        response.set_etag(etag)
+    if rendered.last_modified:
+        response.last_modified = rendered.last_modified
+    return response.make_conditional(request)
+
 @app.teardown_appcontext
 def close_db(error):
     """Closes the database again at the end of the request."""
@@ -159,6 +197,14 @@ def processed_topic_feed(topic, format):
         if format not in ['rss', 'atom']:
             return f"Unsupported format: {format}. Use 'rss' or 'atom'", 400
 
+        # Served from the render cache (or with a 304) until the scheduler saves a new version of the topic
+        render_cache = get_render_cache()
+        cache_key = ('topic', topic, format)
+        version = store_module.feed_version(get_db, store_module.TOPIC_VERSION_SOURCE, topic)
+        rendered = render_cache.get(cache_key, version)
+        if rendered:
+            return feed_response(rendered)
+
         # Get processed data from the database
         processed_data = store_module.get_processed_topic(get_db(), topic)
 
@@ -172,15 +218,19 @@ def processed_topic_feed(topic, format):
         feed_description = f"Notícias agregadas e processadas sobre {topic.replace('_', ' ')}."
 
         if format == 'rss':
-            feed_content = feed_generator.generate_rss(articles, title=feed_title, description=feed_description)
+            feed_content = feed_generator.generate_rss(articles, title=feed_title, description=feed_description,
+                                                       writer=TOPIC_FEED_WRITER)
             content_type = 'application/rss+xml'
         else:  # atom
-            feed_content = feed_generator.generate_atom(articles, title=feed_title, description=feed_description)
+            feed_content = feed_generator.generate_atom(articles, title=feed_title, description=feed_description,
+                                                        writer=TOPIC_FEED_WRITER)
             content_type = 'application/atom+xml'
 
-        response = Response(feed_content, mimetype=content_type)
-        response.headers['Cache-Control'] = 'public, max-age=900'  # 15 minutes cache
-        return response
+        body = feed_content.encode('utf-8')
+        etag, last_modified = content_validators(body, articles)
+        rendered = RenderedFeed(body, content_type, version, etag=etag, last_modified=last_modified)
+        render_cache.put(cache_key, rendered)
+        return feed_response(rendered)
 
     except Exception as e:
         logger.error(f"Error generating processed {format} feed for topic {topic}: {e}", exc_info=True)
@@ -206,6 +256,17 @@ def dynamic_feeds(source, section, format):
         query = request.args.get('q', '')
         force_refresh = request.args.get('refresh') == '1'
         
+        # Identical requests are answered from the render cache (or with a 304 when the
+        # client sent the entry's ETag) until an insert bumps the section's version or
+        # the entry reaches the 5-minute refresh check below
+        render_cache = get_render_cache()
+        cache_key = (source, section, format, limit, query)
+        version = store_module.feed_version(get_db, source, section)
+        if not force_refresh:
+            rendered = render_cache.get(cache_key, version)
+            if rendered:
+                return feed_response(rendered)
+        
         # Get section-specific filters
         section_config = SOURCES[source]['sections'][section]
         exclude_authors = section_config.get('filters', {}).get('exclude_authors', [])
@@ -223,6 +284,7 @@ def dynamic_feeds(source, section, format):
         
         # Decide if a refresh is needed
         should_refresh = False
+        last_update = None
         if force_refresh:
             should_refresh = True
             logger.info(f"Force refresh requested for {source}/{section}")
@@ -252,6 +314,7 @@ def dynamic_feeds(source, section, format):
             # Update stats in the database
             store_module.update_feed_stats(get_db(), source, section, links_found, added_count)
 
+            version = store_module.feed_version(get_db, source, section)
             articles = store_module.get_recent_articles(
                 conn=get_db(),
                 limit=limit,
@@ -313,22 +376,26 @@ def dynamic_feeds(source, section, format):
                 fg.lastBuildDate(dt_obj)
 
             feed_content = fg.rss_str(pretty=True).decode('utf-8')
-            
-            response = Response(feed_content, mimetype='application/rss+xml')
-            response.headers['Cache-Control'] = 'public, max-age=900'
-            return response
+            content_type = 'application/rss+xml'
 
-        # Generate feed
-        if format == 'rss':
-            feed_content = feed_generator.generate_rss(articles, source=source, section=section)
+        elif format == 'rss':  # Generate feed
+            feed_content = feed_generator.generate_rss(articles, source=source, section=section,
+                                                       writer=SOURCES[source].get('feed_writer', FEED_WRITER))
             content_type = 'application/rss+xml'
         else:  # atom
-            feed_content = feed_generator.generate_atom(articles, source=source, section=section)
+            feed_content = feed_generator.generate_atom(articles, source=source, section=section,
+                                                        writer=SOURCES[source].get('feed_writer', FEED_WRITER))
             content_type = 'application/atom+xml'
         
-        response = Response(feed_content, mimetype=content_type)
-        response.headers['Cache-Control'] = 'public, max-age=900'  # 15 minutes cache
-        return response
+        body = feed_content.encode('utf-8')
+        etag, last_modified = content_validators(body, articles)
+        rendered = RenderedFeed(body, content_type, version, etag=etag, last_modified=last_modified)
+        if articles:
+            # Hits skip the staleness check, so the entry expires when it would next be due
+            refreshed_at = datetime.now(timezone.utc) if should_refresh else last_update
+            rendered.stale_at = (refreshed_at + timedelta(minutes=5)).timestamp()
+            render_cache.put(cache_key, rendered)
+        return feed_response(rendered)
     
     except Exception as e:
         logger.error(f"Error generating {format} feed for {source}/{section}: {e}")
@@ -472,7 +539,16 @@ def admin_stats():
         return jsonify({'error': 'Chave de administrador inválida.'}), 401
     try:
 
-        detailed_stats = store.get_detailed_stats()
+        detailed_stats = store_module.get_stats(get_db())
+        detailed_stats['http_cache'] = get_response_cache().stats()
+        detailed_stats['rate_limit_wait_seconds'] = get_rate_limiter().stats()
+        detailed_stats['robots_cache'] = get_robots_cache().stats()
+        detailed_stats['head_only_fetch'] = get_head_fetch_stats()
+        detailed_stats['fast_extractor'] = get_parity_monitor().stats()
+        detailed_stats['parse_pool'] = get_parse_pool().stats()
+        detailed_stats['pagination'] = get_pagination_stats()
+        detailed_stats['retention'] = scheduler.last_retention
+        detailed_stats['render_cache'] = get_render_cache().stats()
         return jsonify(detailed_stats)
 
     except Exception as e:
@@ -17,6 +17,10 @@ SOURCES_CONFIG = {
         'name': 'Globo Esporte',
         'base_url': 'https://ge.globo.com',
         'language': 'pt-BR',
+        'cache_ttl': 3600,  # articles are updated often; keep cached pages for 1h
+        'rate_limit': {'rate': 1.0, 'burst': 3},  # globo.com blocks aggressive clients
+        'head_only': True,  # article pages are 300 KB-1 MB; metadata is all in the <head>
+        'extractor': 'lxml',  # fast metadata extraction, sampled against BeautifulSoup
         'scraper_class': 'GloboScraper',
         'sections': {
             'futebol': {
@@ -31,6 +35,10 @@ SOURCES_CONFIG = {
         'name': 'G1',
         'base_url': 'https://g1.globo.com',
         'language': 'pt-BR',
+        'cache_ttl': 3600,  # articles are updated often; keep cached pages for 1h
+        'rate_limit': {'rate': 1.0, 'burst': 3},  # globo.com blocks aggressive clients
+        'head_only': True,  # article pages are 300 KB-1 MB; metadata is all in the <head>
+        'extractor': 'lxml',  # fast metadata extraction, sampled against BeautifulSoup
         'scraper_class': 'G1Scraper',
         'sections': {
             'economia': {
@@ -236,6 +244,7 @@ SOURCES_CONFIG = {
         'name': 'A Bola',
         'base_url': 'https://www.abola.pt',
         'official_rss': 'https://www.abola.pt/rss-articles.xml',
+        'ingest': 'rss',  # articles built from feed items; pages fetched only for missing fields
         'language': 'pt-PT',
         'scraper_class': 'ABolaScraper',
         'sections': {
@@ -252,6 +261,7 @@ SOURCES_CONFIG = {
         'base_url': 'https://www.foxsports.com',
         'language': 'en-US',
         'scraper_class': 'FoxSportsScraper',
+        'ingest': 'rss',  # articles built from feed items; pages fetched only for missing fields
         'sections': {
             'nfl': {
                 'name': 'NFL News',
@@ -284,6 +294,7 @@ SOURCES_CONFIG = {
         'base_url': 'https://www.cbssports.com',
         'language': 'en-US',
         'scraper_class': 'CBSSportsScraper',
+        'ingest': 'rss',  # articles built from feed items; pages fetched only for missing fields
         'sections': {
             'nfl': {
                 'name': 'NFL',
@@ -5,14 +5,65 @@ import pytz
 import os
 import re
 import json
+import threading
+import time
+import zlib
 
 from .sources_config import SOURCES_CONFIG
+from .bloom import BloomFilter
+from .utils import parse_query_filter
+
+try:
+    from . import pg_store
+except ImportError:  # psycopg2 not installed: SQLite only
+    pg_store = None
 
 logger = logging.getLogger(__name__)
 
 DB_PATH = 'articles.db'
+# postgres://... selects the PostgreSQL backend (see pg_store); anything else keeps SQLite
+DATABASE_URL = os.environ.get("DATABASE_URL")
 TZ = pytz.timezone("America/Sao_Paulo")
 
+# Connection tuning (see _PooledConnection)
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.environ.get("SQLITE_CACHE_SIZE_KB", "20000"))
+SQLITE_MMAP_SIZE = int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+
+class _PooledConnection(sqlite3.Connection):
+    """
+    Thread-local connection handed out by ArticleStore.get_conn. Callers keep
+    calling close() when they are done; it only ends any open transaction, the
+    connection itself stays open for the next caller on the same thread.
+    """
+
+    def close(self):
+        if self.in_transaction:
+            self.rollback()
+
+    def really_close(self):
+        super().close()
+
+
+def _open_connection(db_path):
+    conn = sqlite3.connect(db_path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, factory=_PooledConnection)
+    conn.db_path = db_path  # lets module functions find the URL filter of this database
+    # Takes effect only on a brand-new file (before the WAL switch writes its header);
+    # older files are converted once by run_retention
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    # WAL lets feed reads proceed while the scheduler writes; NORMAL is durable enough under WAL
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+
+def _is_postgres(conn):
+    return pg_store is not None and isinstance(conn, pg_store.PgConnection)
+
 def _now_br_iso():
     return datetime.now(TZ).strftime("%Y-%m-%d %H:%M:%S")
 
@@ -23,6 +74,31 @@ def _add_column_if_not_exists(cursor, table_name, column_name, column_type):
         logger.info(f"Adding column '{column_name}' to table '{table_name}'.")
         cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}")
 
+def _epoch_ms(dt):
+    """UTC epoch milliseconds of a datetime; naive datetimes are taken as UTC."""
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return int(dt.timestamp() * 1000)
+
+def _from_ms(ms):
+    """Aware UTC datetime for an epoch-milliseconds column value."""
+    if ms is None:
+        return None
+    return datetime.fromtimestamp(ms / 1000, timezone.utc)
+
+def _utc_iso(dt):
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+def _sort_key(dt):
+    """Epoch milliseconds of an article's best date, the order feeds are served in."""
+    return _epoch_ms(dt)
+
 def _parse_date(date_str):
     if not date_str:
         return None
@@ -37,55 +113,372 @@ def _parse_date(date_str):
 
 def get_stats(conn):
     try:
+        if _is_postgres(conn):
+            return pg_store.get_stats(conn)
         cursor = conn.cursor()
         cursor.execute('SELECT COUNT(*) FROM articles')
         total_articles = cursor.fetchone()[0]
-        cursor.execute('SELECT MAX(scraped_at) FROM articles')
-        last_update = cursor.fetchone()[0]
-        return {'total_articles': total_articles, 'last_update': last_update}
+        cursor.execute('SELECT MAX(scraped_ms) FROM articles')
+        last_update = _from_ms(cursor.fetchone()[0])
+        return {'total_articles': total_articles, 'last_update': last_update.isoformat() if last_update else None}
     except Exception as e:
+        conn.rollback()
         logger.error(f"Error getting stats: {e}")
         return {'total_articles': 0, 'last_update': None}
 
+def _backfill_sort_keys(cursor):
+    """Fills sort_key for rows written before the column existed."""
+    rows = cursor.execute(
+        "SELECT id, date_published, scraped_at FROM articles WHERE sort_key IS NULL"
+    ).fetchall()
+    if not rows:
+        return
+    # Unparseable dates get 0 so they sort last and are not revisited on every start
+    updates = [(_sort_key(_parse_date(published) or _parse_date(scraped)) or 0, row_id)
+               for row_id, published, scraped in rows]
+    cursor.executemany("UPDATE articles SET sort_key = ? WHERE id = ?", updates)
+    logger.info(f"Backfilled sort_key for {len(updates)} articles.")
+
+def _backfill_epoch_ms(cursor):
+    """
+    One-time migration of the ISO text timestamps to the *_ms columns. Old rows mix
+    UTC offsets with naive values (written as UTC), so naive strings are read as UTC;
+    feeds.last_refreshed_at was written in São Paulo local time.
+    """
+    rows = cursor.execute(
+        "SELECT id, date_published, date_modified, scraped_at FROM articles WHERE scraped_ms IS NULL"
+    ).fetchall()
+    if rows:
+        # scraped_at is NOT NULL; an unparseable one becomes 0 so the row is not revisited
+        updates = [(_epoch_ms(_parse_date(published)), _epoch_ms(_parse_date(modified)),
+                    _epoch_ms(_parse_date(scraped)) or 0, row_id)
+                   for row_id, published, modified, scraped in rows]
+        cursor.executemany(
+            "UPDATE articles SET published_ms = ?, modified_ms = ?, scraped_ms = ? WHERE id = ?", updates
+        )
+        logger.info(f"Migrated timestamps of {len(updates)} articles to epoch milliseconds.")
+
+    feeds = cursor.execute(
+        "SELECT source, path, last_refreshed_at FROM feeds "
+        "WHERE last_refreshed_ms IS NULL AND last_refreshed_at IS NOT NULL"
+    ).fetchall()
+    updates = []
+    for source, path, refreshed in feeds:
+        try:
+            dt = datetime.fromisoformat(refreshed)
+        except (ValueError, TypeError):
+            continue
+        updates.append((_epoch_ms(TZ.localize(dt) if dt.tzinfo is None else dt), source, path))
+    if updates:
+        cursor.executemany("UPDATE feeds SET last_refreshed_ms = ? WHERE source = ? AND path = ?", updates)
+
+# Full-text index over title/description/author, used by the ?q= feed search.
+# External content table: the text lives in articles only, triggers keep the index in sync.
+_FTS_TRIGGERS = {
+    'articles_fts_ai': """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+            INSERT INTO articles_fts(rowid, title, description, author)
+            VALUES (new.id, new.title, new.description, new.author);
+        END""",
+    'articles_fts_ad': """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, title, description, author)
+            VALUES ('delete', old.id, old.title, old.description, old.author);
+        END""",
+    'articles_fts_au': """
+        CREATE TRIGGER IF NOT EXISTS articles_fts_au AFTER UPDATE OF title, description, author ON articles BEGIN
+            INSERT INTO articles_fts(articles_fts, rowid, title, description, author)
+            VALUES ('delete', old.id, old.title, old.description, old.author);
+            INSERT INTO articles_fts(rowid, title, description, author)
+            VALUES (new.id, new.title, new.description, new.author);
+        END""",
+}
+
+# False when this SQLite build has no FTS5; searches then fall back to LIKE
+_fts_available = True
+
+def _init_fts(cursor):
+    """Creates the articles_fts index and its triggers, indexing existing rows on first creation."""
+    global _fts_available
+    exists = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    ).fetchone()
+    try:
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, description, author,
+                content='articles', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        _fts_available = False
+        logger.warning(f"FTS5 not available ({e}); feed search will use LIKE.")
+        return
+    for trigger_sql in _FTS_TRIGGERS.values():
+        cursor.execute(trigger_sql)
+    if not exists:
+        cursor.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+        logger.info("Built full-text index for existing articles.")
+    _fts_available = True
+
+# A search matching at least this many articles walks the feed order and probes the index
+# per row; rarer ones collect their matches first. Either way only ~limit rows are read.
+FTS_COMMON_MATCHES = int(os.environ.get("FTS_COMMON_MATCHES", "1000"))
+
+def _fts_is_common(conn, expression):
+    row = conn.execute(
+        "SELECT count(*) FROM (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ? LIMIT ?)",
+        (expression, FTS_COMMON_MATCHES),
+    ).fetchone()
+    return row[0] >= FTS_COMMON_MATCHES
+
+def _search_conditions(conn, query_filter, use_fts):
+    """WHERE conditions and params for a parsed ?q= filter (see utils.parse_query_filter)."""
+    conditions, params = [], []
+    if use_fts:
+        if query_filter.get('fts'):
+            if _fts_is_common(conn, query_filter['fts']):
+                conditions.append("EXISTS (SELECT 1 FROM articles_fts WHERE articles_fts MATCH ? AND rowid = articles.id)")
+            else:
+                conditions.append("id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?)")
+            params.append(query_filter['fts'])
+        if query_filter.get('fts_exclude'):
+            # Only checked for rows that pass everything else, so a common excluded word stays cheap
+            conditions.append("NOT EXISTS (SELECT 1 FROM articles_fts WHERE articles_fts MATCH ? AND rowid = articles.id)")
+            params.append(query_filter['fts_exclude'])
+        return conditions, params
+    # LIKE fallback: the same AND/OR expression as the FTS query, none of the excluded words
+    like_parts = []
+    for part in query_filter.get('like', []):
+        if isinstance(part, tuple):
+            like_parts.append("(title LIKE ? OR description LIKE ?)")
+            params.extend([f'%{part[0]}%', f'%{part[0]}%'])
+        else:
+            like_parts.append(part)
+    if like_parts:
+        conditions.append(f"({' '.join(like_parts)})")
+    for term in query_filter.get('exclude', []):
+        conditions.append("(title NOT LIKE ? AND COALESCE(description, '') NOT LIKE ?)")
+        params.extend([f'%{term}%', f'%{term}%'])
+    return conditions, params
+
+class _UrlFilter:
+    """
+    Bloom filter of stored canonical URLs, both bare and scoped by (source, section).
+    Built from the table at startup, then kept current by adding rows with an id above
+    the last one seen, so inserts made by other workers are picked up as well.
+    Deleted rows stay in the filter; they only cost a confirming query.
+    """
+
+    def __init__(self):
+        self.bloom = None
+        self.last_id = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def scoped_key(source, section, canonical):
+        return f"{source}\x00{section}\x00{canonical}"
+
+    def sync(self, conn):
+        with self.lock:
+            if self.bloom is None or self.bloom.full:
+                total = conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+                # Two keys per row, with room to grow before the next rebuild
+                self.bloom = BloomFilter(capacity=max(4 * total, 100_000))
+                self.last_id = 0
+            rows = conn.execute(
+                "SELECT id, source, section, canonical_url FROM articles WHERE id > ? ORDER BY id", (self.last_id,)
+            ).fetchall()
+            for row_id, source, section, canonical in rows:
+                if canonical:
+                    self.bloom.add(canonical)
+                    self.bloom.add(self.scoped_key(source, section, canonical))
+                self.last_id = row_id
+            return len(rows)
+
+    def may_contain(self, canonical, source=None, section=None):
+        if source and section:
+            return self.scoped_key(source, section, canonical) in self.bloom
+        return canonical in self.bloom
+
+
+_url_filters = {}
+_url_filters_lock = threading.Lock()
+
+
+def _url_filter(conn):
+    """The URL filter of conn's database, synced with rows inserted since the last call."""
+    db_path = getattr(conn, 'db_path', None)
+    if db_path is None:
+        return None  # plain sqlite3 connection: no filter, always ask the database
+    with _url_filters_lock:
+        url_filter = _url_filters.setdefault(db_path, _UrlFilter())
+    url_filter.sync(conn)
+    return url_filter
+
+
 def has_article(conn, url: str) -> bool:
+    return bool(known_urls(conn, [url]))
+
+def known_urls(conn, urls, source=None, section=None) -> set:
+    """
+    Returns the subset of urls already stored (matched on canonical URL), in bulk.
+    With source/section the lookup is scoped to that feed and served by its unique index.
+    A Bloom filter answers for URLs that were never stored; only possible hits are
+    confirmed with a query.
+    """
+    from .utils import canonical_url as c_url
+    by_canonical = {}
+    for url in urls:
+        by_canonical.setdefault(c_url(url) or url, []).append(url)
+    known = set()
     try:
+        if _is_postgres(conn):
+            # One indexed = ANY() query; no Bloom filter in front of a shared database
+            for canonical in pg_store.known_urls(conn, by_canonical, source, section if source else None):
+                known.update(by_canonical[canonical])
+            conn.rollback()
+            return known
         cursor = conn.cursor()
-        cursor.execute('SELECT 1 FROM articles WHERE url = ?', (url,))
-        return cursor.fetchone() is not None
+        url_filter = _url_filter(conn)
+        keys = list(by_canonical)
+        if url_filter is not None:
+            keys = [k for k in keys if url_filter.may_contain(k, source, section)]
+        for i in range(0, len(keys), 500):  # stay under SQLite's bound-parameter limit
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' for _ in chunk)
+            scope, params = '', []
+            if source:
+                scope += " AND source = ?"
+                params.append(source)
+                if section:
+                    scope += " AND section = ?"
+                    params.append(section)
+            cursor.execute(
+                f"SELECT DISTINCT canonical_url FROM articles WHERE canonical_url IN ({placeholders}){scope}",
+                chunk + params,
+            )
+            for (canonical,) in cursor.fetchall():
+                known.update(by_canonical.get(canonical, ()))
     except Exception as e:
-        logger.error(f"Error checking for article {url}: {e}")
-        return False
+        conn.rollback()
+        logger.error(f"Error checking known URLs: {e}")
+    return known
 
-def upsert_article(conn, article: dict) -> bool:
+_INSERT_ARTICLE_SQL = """
+    INSERT INTO articles 
+    (url, canonical_url, source, section, title, description, image, author, date_published, date_modified, scraped_at,
+     published_ms, modified_ms, scraped_ms, sort_key)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(source, section, canonical_url) DO NOTHING
+"""
+
+def _article_row(article: dict) -> tuple:
     from .utils import canonical_url as c_url
+    date_published, date_modified = article.get('date_published'), article.get('date_modified')
+    fetched_at = article['fetched_at']
+    # The ISO columns are kept (in UTC) for readability; queries only use the *_ms ones
+    return (
+        article['url'], c_url(article['url']), article.get('source', 'unknown'),
+        article.get('section', 'general'), article['title'], article['description'],
+        article['image'], article['author'],
+        _utc_iso(date_published), _utc_iso(date_modified), _utc_iso(fetched_at),
+        _epoch_ms(date_published), _epoch_ms(date_modified), _epoch_ms(fetched_at),
+        _sort_key(date_published or fetched_at)
+    )
+
+def upsert_article(conn, article: dict) -> bool:
+    """Inserts one article; returns True only if it was new (False on conflict or error)."""
     try:
+        if _is_postgres(conn):
+            inserted = pg_store.insert_rows(conn, [_article_row(article)])
+            _note_feed_versions({key[:2] for key in inserted})
+            return bool(inserted)
+        row = _article_row(article)
         cursor = conn.cursor()
-        date_published = article['date_published'].isoformat() if article.get('date_published') else None
-        date_modified = article['date_modified'].isoformat() if article.get('date_modified') else None
-        scraped_at = article['fetched_at'].isoformat()
-        canonical = c_url(article['url'])
-        cursor.execute("""
-            INSERT INTO articles 
-            (url, canonical_url, source, section, title, description, image, author, date_published, date_modified, scraped_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(source, section, canonical_url) DO NOTHING
-        """, (
-            article['url'], canonical, article.get('source', 'unknown'),
-            article.get('section', 'general'), article['title'], article['description'],
-            article['image'], article['author'],
-            date_published, date_modified, scraped_at
-        ))
+        cursor.execute(_INSERT_ARTICLE_SQL, row)
+        inserted = cursor.rowcount == 1
+        if inserted:
+            _bump_feed_versions(cursor, [(row[2], row[3])])
         conn.commit()
-        return True
+        if inserted:
+            _note_feed_versions([(row[2], row[3])])
+        return inserted
     except Exception as e:
+        conn.rollback()
         logger.error(f"Error upserting article {article.get('url')}: {e}", exc_info=True)
         return False
 
+def upsert_many(conn, articles) -> list:
+    """
+    Inserts a batch of articles in a single transaction and returns the ones that
+    were actually new. Existing (source, section, canonical_url) keys are looked up
+    in bulk inside the write transaction, so the result is exact even with other
+    writers; duplicates within the batch count once. On Postgres, INSERT ... ON CONFLICT
+    DO NOTHING RETURNING reports the inserted keys directly.
+    """
+    rows = []
+    for article in articles:
+        try:
+            rows.append((article, _article_row(article)))
+        except Exception as e:
+            logger.error(f"Skipping malformed article {article.get('url')}: {e}")
+    if not rows:
+        return []
+    try:
+        if _is_postgres(conn):
+            unique_rows = {}
+            for article, row in rows:
+                unique_rows.setdefault((row[2], row[3], row[1]), (article, row))
+            inserted = pg_store.insert_rows(conn, [row for _, row in unique_rows.values()])
+            _note_feed_versions({key[:2] for key in inserted})
+            new_articles = [article for key, (article, _) in unique_rows.items() if key in inserted]
+            logger.info(f"Stored {len(new_articles)} new articles ({len(rows) - len(new_articles)} already present)")
+            return new_articles
+        cursor = conn.cursor()
+        if conn.in_transaction:
+            conn.commit()
+        # IMMEDIATE takes the write lock up front: nobody can insert between the check and the insert
+        cursor.execute("BEGIN IMMEDIATE")
+        existing = set()
+        canonicals = list({row[1] for _, row in rows})
+        for i in range(0, len(canonicals), 500):  # stay under SQLite's bound-parameter limit
+            chunk = canonicals[i:i + 500]
+            placeholders = ','.join('?' for _ in chunk)
+            cursor.execute(
+                f"SELECT source, section, canonical_url FROM articles WHERE canonical_url IN ({placeholders})", chunk
+            )
+            existing.update(cursor.fetchall())
+
+        new_articles, new_rows = [], []
+        for article, row in rows:
+            key = (row[2], row[3], row[1])
+            if key in existing:
+                continue
+            existing.add(key)
+            new_articles.append(article)
+            new_rows.append(row)
+        sections = sorted({(row[2], row[3]) for row in new_rows})
+        if new_rows:
+            cursor.executemany(_INSERT_ARTICLE_SQL, new_rows)
+            _bump_feed_versions(cursor, sections)
+        conn.commit()
+        _note_feed_versions(sections)
+        logger.info(f"Stored {len(new_rows)} new articles ({len(rows) - len(new_rows)} already present)")
+        return new_articles
+    except Exception as e:
+        conn.rollback()
+        logger.error(f"Error storing batch of {len(rows)} articles: {e}", exc_info=True)
+        return []
+
 def get_recent_articles(conn, limit=30, hours=72, query_filter=None, source=None, section=None, exclude_authors=None):
     try:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-        where_conditions = ["scraped_at >= ?"]
-        params = [cutoff_time.isoformat()]
+        # Unary + keeps scraped_ms out of index selection: the window is filtered while
+        # walking a sort_key index, so rows come out in feed order without a sort
+        where_conditions = ["+scraped_ms >= ?"]
+        params = [_epoch_ms(cutoff_time)]
         if source:
             where_conditions.append("source = ?")
             params.append(source)
@@ -96,189 +489,577 @@ def get_recent_articles(conn, limit=30, hours=72, query_filter=None, source=None
             placeholders = ','.join(['?' for _ in exclude_authors])
             where_conditions.append(f"(author IS NULL OR author NOT IN ({placeholders}))")
             params.extend(exclude_authors)
-        if query_filter:
-            search_terms = query_filter.get('terms', [])
-            if search_terms:
-                like_conditions = ["(title LIKE ? OR description LIKE ?)" for _ in search_terms]
-                where_conditions.append(f"({' OR '.join(like_conditions)})")
-                for term in search_terms:
-                    params.extend([f'%{term}%', f'%{term}%'])
-        where_clause = ' AND '.join(where_conditions)
-        query = f"""
-            SELECT url, source, section, title, description, image, author, date_published, date_modified, scraped_at as fetched_at
-            FROM articles 
-            WHERE {where_clause}
-            ORDER BY COALESCE(date_published, scraped_at) DESC
-            LIMIT ?
-        """
-        params.append(limit)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute(query, params)
+        if isinstance(query_filter, str):
+            query_filter = parse_query_filter(query_filter)
+        if _is_postgres(conn):
+            articles = pg_store.get_recent_articles(conn, _epoch_ms(cutoff_time), limit, query_filter,
+                                                    source, section, exclude_authors, FTS_COMMON_MATCHES)
+            logger.debug(f"Retrieved {len(articles)} articles")
+            return articles
+        use_fts = bool(query_filter) and _fts_available
+        while True:
+            conditions, search_params = _search_conditions(conn, query_filter, use_fts) if query_filter else ([], [])
+            where_clause = ' AND '.join(where_conditions + conditions)
+            query = f"""
+                SELECT url, source, section, title, description, image, author, published_ms, modified_ms, scraped_ms
+                FROM articles 
+                WHERE {where_clause}
+                ORDER BY sort_key DESC
+                LIMIT ?
+            """
+            cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row  # cursor-level: the connection is shared by the thread
+            try:
+                cursor.execute(query, params + search_params + [limit])
+            except sqlite3.OperationalError as e:
+                if not use_fts:
+                    raise
+                # Missing index (e.g. a database created by an FTS-less build) or a query FTS5 rejects
+                logger.warning(f"Full-text search failed for {query_filter.get('raw')!r} ({e}); using LIKE")
+                use_fts = False
+                continue
+            break
         rows = cursor.fetchall()
-        articles = [dict(row) for row in rows]
-        for article in articles:
-            article['date_published'] = _parse_date(article['date_published'])
-            article['date_modified'] = _parse_date(article.get('date_modified'))
-            article['fetched_at'] = _parse_date(article['fetched_at'])
+        articles = []
+        for row in rows:
+            article = dict(row)
+            article['date_published'] = _from_ms(article.pop('published_ms'))
+            article['date_modified'] = _from_ms(article.pop('modified_ms'))
+            article['fetched_at'] = _from_ms(article.pop('scraped_ms'))
+            articles.append(article)
         logger.debug(f"Retrieved {len(articles)} articles")
         return articles
     except Exception as e:
+        conn.rollback()
         logger.error(f"Error getting recent articles: {e}", exc_info=True)
         return []
 
-def cleanup_old_articles(conn, days_to_keep=30):
-    try:
-        cutoff_date = datetime.now(timezone.utc) - timedelta(days=days_to_keep)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM articles WHERE scraped_at < ?', (cutoff_date.isoformat(),))
-        deleted_count = cursor.rowcount
+# Retention job (scheduled by FeedScheduler)
+RETENTION_DAYS = int(os.environ.get("RETENTION_DAYS", "30"))
+RETENTION_BATCH_SIZE = int(os.environ.get("RETENTION_BATCH_SIZE", "500"))       # ids per DELETE
+RETENTION_PAUSE_SECONDS = float(os.environ.get("RETENTION_PAUSE_SECONDS", "0.05"))  # between batches
+RETENTION_VACUUM_PAGES = int(os.environ.get("RETENTION_VACUUM_PAGES", "1000"))  # pages freed per step
+
+# Article URLs that should never have been stored (pages that are not articles)
+INVALID_URL_PATTERNS = {
+    'ole': ["/suscripciones/", "/estadisticas/", "/agenda/"],
+    'abola': ["/video/", "/a-bola-tv/"],
+}
+
+def _retention_bounds(conn, cutoff_ms):
+    """Lowest and highest id of the articles scraped before cutoff_ms."""
+    if _is_postgres(conn):
+        return pg_store.retention_bounds(conn, cutoff_ms)
+    return conn.execute("SELECT MIN(id), MAX(id) FROM articles WHERE scraped_ms < ?", (cutoff_ms,)).fetchone()
+
+def _delete_id_range(conn, low, high, cutoff_ms):
+    """Deletes the expired articles with low <= id < high in one short transaction."""
+    if _is_postgres(conn):
+        return pg_store.delete_scraped_range(conn, low, high, cutoff_ms)
+    cursor = conn.execute(
+        "DELETE FROM articles WHERE id >= ? AND id < ? AND scraped_ms < ?", (low, high, cutoff_ms)
+    )
+    conn.commit()
+    return cursor.rowcount
+
+def _ensure_incremental_vacuum(conn):
+    """
+    Switches an existing SQLite file to auto_vacuum=INCREMENTAL. The mode can only change
+    through a full VACUUM, so this rewrites the file once; new databases start in it.
+    """
+    if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+        return
+    logger.info("Converting database to auto_vacuum=INCREMENTAL (one-time VACUUM)...")
+    if conn.in_transaction:
         conn.commit()
-        if deleted_count > 0:
-            logger.info(f"Cleaned up {deleted_count} old articles.")
-        return deleted_count
+    conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.execute("VACUUM")
+
+def _page_count(conn):
+    return conn.execute("PRAGMA page_count").fetchone()[0]
+
+def _incremental_vacuum(conn, pause):
+    """Returns free pages to the filesystem in small steps."""
+    # Only the pages free now: concurrent writers keep freeing and reusing pages
+    remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    while remaining > 0:
+        step = min(remaining, RETENTION_VACUUM_PAGES)
+        # executescript steps the pragma to completion; execute() frees a single page per call
+        conn.executescript(f"PRAGMA incremental_vacuum({step});")
+        remaining -= step
+        time.sleep(pause)
+    # Under WAL the file itself shrinks once the freed pages are checkpointed
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+
+def delete_invalid_articles(conn):
+    """Removes stored articles whose URL matches INVALID_URL_PATTERNS; returns how many."""
+    total = 0
+    for source_name, patterns in INVALID_URL_PATTERNS.items():
+        try:
+            if _is_postgres(conn):
+                deleted_count = pg_store.delete_matching_urls(conn, source_name, patterns)
+            else:
+                like_conditions = " OR ".join(["url LIKE ?" for _ in patterns])
+                cursor = conn.execute(
+                    f"DELETE FROM articles WHERE source = ? AND ({like_conditions})",
+                    [source_name] + [f'%{p}%' for p in patterns],
+                )
+                deleted_count = cursor.rowcount
+                conn.commit()
+            if deleted_count > 0:
+                logger.info(f"Cleaned up {deleted_count} invalid {source_name} articles.")
+            total += deleted_count
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Failed to perform {source_name} cleanup: {e}")
+    return total
+
+def run_retention(conn, days_to_keep=RETENTION_DAYS, batch_size=RETENTION_BATCH_SIZE,
+                  pause=RETENTION_PAUSE_SECONDS):
+    """
+    Deletes articles scraped more than days_to_keep days ago, plus invalid URLs, and
+    gives the space back.
+
+    Expired rows are deleted by id range, batch_size ids per transaction, sleeping
+    `pause` seconds between batches so scrapers and feed reads can take the write lock
+    in between. On SQLite the freed pages are then released with incremental_vacuum;
+    on PostgreSQL autovacuum reclaims them and bytes_reclaimed is None.
+    """
+    started = time.monotonic()
+    report = {'deleted': 0, 'invalid_deleted': 0, 'batches': 0, 'bytes_reclaimed': None, 'duration_seconds': 0.0}
+    try:
+        cutoff_ms = _epoch_ms(datetime.now(timezone.utc) - timedelta(days=days_to_keep))
+        report['invalid_deleted'] = delete_invalid_articles(conn)
+        low, high = _retention_bounds(conn, cutoff_ms)
+        if low is not None:
+            # ids grow with scrape time, so expired rows sit in a compact range at the start
+            while low <= high:
+                deleted = _delete_id_range(conn, low, low + batch_size, cutoff_ms)
+                report['deleted'] += deleted
+                report['batches'] += 1
+                low += batch_size
+                if deleted:
+                    time.sleep(pause)
+        if not _is_postgres(conn):
+            pages_before = _page_count(conn)
+            _ensure_incremental_vacuum(conn)
+            _incremental_vacuum(conn, pause)
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            report['bytes_reclaimed'] = (pages_before - _page_count(conn)) * page_size
+        if report['deleted'] > 0:
+            logger.info(f"Cleaned up {report['deleted']} old articles.")
     except Exception as e:
-        logger.error(f"Error cleaning up old articles: {e}", exc_info=True)
-        return 0
+        conn.rollback()
+        logger.error(f"Error running retention: {e}", exc_info=True)
+    report['duration_seconds'] = round(time.monotonic() - started, 3)
+    return report
+
+def cleanup_old_articles(conn, days_to_keep=RETENTION_DAYS):
+    """Deletes expired articles (see run_retention) and returns how many were removed."""
+    return run_retention(conn, days_to_keep)['deleted']
 
 def get_last_update_for_section(conn, source, section):
     try:
+        if _is_postgres(conn):
+            return pg_store.get_last_update_for_section(conn, source, section)
         cursor = conn.cursor()
-        cursor.execute("SELECT MAX(scraped_at) FROM articles WHERE source = ? AND section = ?", (source, section))
-        result = cursor.fetchone()[0]
-        return _parse_date(result) if result else None
+        cursor.execute("SELECT MAX(scraped_ms) FROM articles WHERE source = ? AND section = ?", (source, section))
+        return _from_ms(cursor.fetchone()[0])
     except Exception as e:
+        conn.rollback()
         logger.error(f"Error getting last update for {source}/{section}: {e}")
         return None
 
 def update_feed_stats(conn, source: str, path: str, found: int, added: int):
+    now_ms = _epoch_ms(datetime.now(timezone.utc))
+    if _is_postgres(conn):
+        pg_store.update_feed_stats(conn, source, path, _now_br_iso(), now_ms, found, added)
+        return
     cur = conn.cursor()
     cur.execute("""
         UPDATE feeds
            SET last_refreshed_at = ?,
+               last_refreshed_ms = ?,
                last_found_count  = ?,
                last_added_count  = ?
          WHERE source = ? AND path = ?
-    """, (_now_br_iso(), found, added, source, path))
+    """, (_now_br_iso(), now_ms, found, added, source, path))
     if cur.rowcount == 0:
         display_name = f"{source}/{path}"
         cur.execute("""
-            INSERT INTO feeds (source, path, display_name, last_refreshed_at, last_found_count, last_added_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (source, path, display_name, _now_br_iso(), found, added))
+            INSERT INTO feeds (source, path, display_name, last_refreshed_at, last_refreshed_ms, last_found_count, last_added_count)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (source, path, display_name, _now_br_iso(), now_ms, found, added))
     conn.commit()
 
 def get_all_feeds_with_stats(conn):
-    cur = conn.cursor()
-    cur.execute("SELECT source, path, display_name, last_refreshed_at, last_found_count, last_added_count FROM feeds ORDER BY display_name ASC")
-    rows = cur.fetchall()
+    if _is_postgres(conn):
+        rows = pg_store.get_feed_rows(conn)
+    else:
+        cur = conn.cursor()
+        cur.execute("SELECT source, path, display_name, last_refreshed_ms, last_found_count, last_added_count FROM feeds ORDER BY display_name ASC")
+        rows = cur.fetchall()
     return [
         {
             "source": r[0],
             "path": r[1],
             "display_name": r[2] or f"{r[0]}/{r[1]}",
-            "last_refreshed_at": r[3],
+            # shown in the dashboard in São Paulo time
+            "last_refreshed_at": _from_ms(r[3]).astimezone(TZ).strftime("%Y-%m-%d %H:%M:%S") if r[3] is not None else None,
+            "last_refreshed_ms": r[3],
             "last_found_count": r[4] or 0,
             "last_added_count": r[5] or 0,
         }
         for r in rows
     ]
 
-def save_processed_topic(conn, topic_name, json_data, updated_at):
+# --- Feed versions ---
+# Every (source, section) has a counter bumped in the same transaction that inserts
+# articles into it; topics use (TOPIC_VERSION_SOURCE, topic_name) and are bumped when
+# the scheduler saves them. Rendered feeds are cached against these (see render_cache).
+# Bumps made by this process count immediately; the ones made by other workers are
+# read from the feed_versions table at most every FEED_VERSION_REFRESH_SECONDS.
+FEED_VERSION_REFRESH_SECONDS = float(os.environ.get("FEED_VERSION_REFRESH_SECONDS", "2"))
+TOPIC_VERSION_SOURCE = 'topic'
+_feed_versions = {}
+_feed_versions_loaded_at = None
+_feed_versions_lock = threading.Lock()
+
+def _bump_feed_versions(cursor, keys):
+    cursor.executemany("""
+        INSERT INTO feed_versions (source, section, version) VALUES (?, ?, 1)
+        ON CONFLICT (source, section) DO UPDATE SET version = version + 1
+    """, list(keys))
+
+def _note_feed_versions(keys):
+    """Applies committed bumps to this process's counters (never ahead of the table)."""
+    with _feed_versions_lock:
+        for key in keys:
+            _feed_versions[key] = _feed_versions.get(key, 0) + 1
+
+def _load_feed_versions(conn):
+    if _is_postgres(conn):
+        return pg_store.get_feed_versions(conn)
+    return conn.execute("SELECT source, section, version FROM feed_versions").fetchall()
+
+def feed_version(get_conn, source, section):
+    """
+    Returns the current version of a feed's content. `get_conn` is only called, to
+    re-read the shared counters, when the last read is older than the refresh interval.
+    """
+    global _feed_versions_loaded_at
+    now = time.monotonic()
+    with _feed_versions_lock:
+        due = _feed_versions_loaded_at is None or now - _feed_versions_loaded_at >= FEED_VERSION_REFRESH_SECONDS
+        if due:
+            _feed_versions_loaded_at = now  # one thread reloads, the rest keep the current values
+    if due:
+        try:
+            rows = _load_feed_versions(get_conn())
+        except Exception as e:
+            logger.warning(f"Could not read feed versions: {e}")
+            rows = []
+        with _feed_versions_lock:
+            for row_source, row_section, version in rows:
+                key = (row_source, row_section)
+                _feed_versions[key] = max(_feed_versions.get(key, 0), version)
+    with _feed_versions_lock:
+        return _feed_versions.get((source, section), 0)
+
+# --- Processed topics ---
+# Topics are stored as zlib-compressed minified JSON in `payload`; `json_data` only
+# holds rows written before that (pretty-printed JSON) and is empty otherwise.
+# Decoded topics are kept per process and reused until the scheduler publishes a
+# new version (a different updated_at), so a feed hit normally reads one small column.
+_topic_cache = {}
+_topic_cache_lock = threading.Lock()
+
+def _encode_topic(data):
+    if not isinstance(data, str):
+        data = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return zlib.compress(data.encode('utf-8'))
+
+def _decode_topic(payload, json_data):
+    if payload is not None:
+        return json.loads(zlib.decompress(bytes(payload)))
+    return json.loads(json_data)
+
+def save_processed_topic(conn, topic_name, data, updated_at):
+    """Stores a processed topic; `data` is the processed dict (a JSON string is also accepted)."""
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO processed_topics (topic_name, json_data, updated_at)
-            VALUES (?, ?, ?)
-        """, (topic_name, json_data, updated_at))
-        conn.commit()
-        logger.info(f"Successfully saved processed topic: {topic_name}")
+        payload = _encode_topic(data)
+        if _is_postgres(conn):
+            pg_store.save_processed_topic(conn, topic_name, payload, updated_at, TOPIC_VERSION_SOURCE)
+        else:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO processed_topics (topic_name, json_data, updated_at, payload)
+                VALUES (?, '', ?, ?)
+            """, (topic_name, updated_at, payload))
+            _bump_feed_versions(cursor, [(TOPIC_VERSION_SOURCE, topic_name)])
+            conn.commit()
+        _note_feed_versions([(TOPIC_VERSION_SOURCE, topic_name)])
+        if not isinstance(data, str):
+            # The writing process already has the decoded object
+            with _topic_cache_lock:
+                _topic_cache[topic_name] = (updated_at, data)
+        logger.info(f"Successfully saved processed topic: {topic_name} ({len(payload)} bytes)")
         return True
     except Exception as e:
+        conn.rollback()
         logger.error(f"Error saving processed topic {topic_name}: {e}", exc_info=True)
         return False
 
 def get_processed_topic(conn, topic_name):
+    """
+    Returns the decoded topic, deserializing only when updated_at has changed.
+
+    The returned object is shared between requests and must not be modified.
+    """
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT json_data FROM processed_topics WHERE topic_name = ?", (topic_name,))
-        row = cursor.fetchone()
-        return json.loads(row[0]) if row else None
+        if _is_postgres(conn):
+            version, fetch = pg_store.get_topic_version, pg_store.get_topic_payload
+        else:
+            version, fetch = _get_topic_version, _get_topic_payload
+        updated_at = version(conn, topic_name)
+        if updated_at is None:
+            return None
+        with _topic_cache_lock:
+            cached = _topic_cache.get(topic_name)
+        if cached and cached[0] == updated_at:
+            return cached[1]
+        row = fetch(conn, topic_name)
+        if not row:
+            return None
+        updated_at, payload, json_data = row
+        data = _decode_topic(payload, json_data)
+        with _topic_cache_lock:
+            _topic_cache[topic_name] = (updated_at, data)
+        return data
     except Exception as e:
+        conn.rollback()
         logger.error(f"Error retrieving processed topic {topic_name}: {e}", exc_info=True)
         return None
 
+def _get_topic_version(conn, topic_name):
+    row = conn.execute("SELECT updated_at FROM processed_topics WHERE topic_name = ?", (topic_name,)).fetchone()
+    return row[0] if row else None
+
+def _get_topic_payload(conn, topic_name):
+    return conn.execute(
+        "SELECT updated_at, payload, json_data FROM processed_topics WHERE topic_name = ?", (topic_name,)
+    ).fetchone()
+
+# --- Schema migrations (SQLite) ---
+# Migration N brings a database from user_version N-1 to N. They are written to be
+# idempotent too, because files created before versioning (user_version 0) already
+# contain some of their changes.
+
+def _migration_1_base_tables(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS articles (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL, canonical_url TEXT,
+            source TEXT NOT NULL, section TEXT, title TEXT NOT NULL, description TEXT,
+            image TEXT, author TEXT, date_published TEXT, date_modified TEXT, scraped_at TEXT NOT NULL
+        )
+    ''')
+    _add_column_if_not_exists(cursor, 'articles', 'canonical_url', 'TEXT')
+    _add_column_if_not_exists(cursor, 'articles', 'date_published', 'TEXT')
+    _add_column_if_not_exists(cursor, 'articles', 'date_modified', 'TEXT')
+    cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_articles_source_section_canonical ON articles (source, section, canonical_url)')
+    # known_urls without a source/section scope looks up canonical_url alone
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_articles_canonical ON articles (canonical_url)')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feeds (
+            source TEXT NOT NULL, path TEXT NOT NULL, display_name TEXT, last_refreshed_at TEXT,
+            last_found_count INTEGER DEFAULT 0, last_added_count INTEGER DEFAULT 0, PRIMARY KEY (source, path)
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS processed_topics (
+            topic_name TEXT PRIMARY KEY, json_data TEXT NOT NULL, updated_at TEXT NOT NULL
+        )
+    ''')
+
+def _migration_2_sort_key(cursor):
+    _add_column_if_not_exists(cursor, 'articles', 'sort_key', 'INTEGER')
+    _backfill_sort_keys(cursor)
+    # Feed queries walk these in order instead of sorting every matching row
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_articles_source_section_sort ON articles (source, section, sort_key DESC)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_articles_sort ON articles (sort_key DESC)')
+
+def _migration_3_full_text(cursor):
+    _init_fts(cursor)
+
+def _migration_4_epoch_ms(cursor):
+    _add_column_if_not_exists(cursor, 'articles', 'published_ms', 'INTEGER')
+    _add_column_if_not_exists(cursor, 'articles', 'modified_ms', 'INTEGER')
+    _add_column_if_not_exists(cursor, 'articles', 'scraped_ms', 'INTEGER')
+    _add_column_if_not_exists(cursor, 'feeds', 'last_refreshed_ms', 'INTEGER')
+    _backfill_epoch_ms(cursor)
+    # Retention cleanup
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_articles_scraped ON articles (scraped_ms)')
+
+def _migration_5_compact_topics(cursor):
+    _add_column_if_not_exists(cursor, 'processed_topics', 'payload', 'BLOB')
+    rows = cursor.execute("SELECT topic_name, json_data FROM processed_topics WHERE payload IS NULL").fetchall()
+    for topic_name, json_data in rows:
+        payload = _encode_topic(json.loads(json_data))
+        cursor.execute("UPDATE processed_topics SET payload = ?, json_data = '' WHERE topic_name = ?",
+                       (payload, topic_name))
+
+def _migration_6_feed_versions(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS feed_versions (
+            source TEXT NOT NULL, section TEXT NOT NULL, version INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (source, section)
+        )
+    ''')
+
+def _migration_7_feed_order_indexes(cursor):
+    # (source, section, scraped_ms) won the feed query over ix_articles_source_section_sort
+    # without ANALYZE statistics, which sorted every row of the window again
+    cursor.execute('DROP INDEX IF EXISTS ix_articles_source_section_scraped')
+    # Feeds of a whole source (e.g. the /feeds/lance routes) in order, like the two above
+    cursor.execute('CREATE INDEX IF NOT EXISTS ix_articles_source_sort ON articles (source, sort_key DESC)')
+
+_MIGRATIONS = [
+    _migration_1_base_tables,
+    _migration_2_sort_key,
+    _migration_3_full_text,
+    _migration_4_epoch_ms,
+    _migration_5_compact_topics,
+    _migration_6_feed_versions,
+    _migration_7_feed_order_indexes,
+]
+SCHEMA_VERSION = len(_MIGRATIONS)
+
+def _migrate(conn):
+    """Runs the migrations this database has not seen yet, recording progress in PRAGMA user_version."""
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
+    if conn.in_transaction:
+        conn.commit()
+    cursor = conn.cursor()
+    # IMMEDIATE: a second worker starting at the same time waits, then sees the new version
+    cursor.execute("BEGIN IMMEDIATE")
+    try:
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        for number, migration in enumerate(_MIGRATIONS[version:], start=version + 1):
+            logger.info(f"Applying schema migration {number}: {migration.__name__}")
+            migration(cursor)
+            cursor.execute(f"PRAGMA user_version = {number}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    logger.info(f"Database schema at version {SCHEMA_VERSION}.")
+
+def _detect_fts(conn):
+    """Sets _fts_available from the schema, for processes that skipped the migrations."""
+    global _fts_available
+    _fts_available = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+    ).fetchone() is not None
+
 class ArticleStore:
-    def __init__(self, db_path=DB_PATH):
+    """
+    Article database: a local SQLite file (db_path), or PostgreSQL when
+    database_url (default: the DATABASE_URL environment variable) is a postgres:// URL.
+    """
+
+    def __init__(self, db_path=DB_PATH, database_url=None):
         self.db_path = db_path
-        if not os.path.exists(self.db_path):
+        self.database_url = database_url if database_url is not None else DATABASE_URL
+        self.is_postgres = pg_store is not None and pg_store.is_postgres_url(self.database_url)
+        if self.database_url and not self.is_postgres and pg_store is None:
+            logger.warning("DATABASE_URL is set but psycopg2 is not installed; using SQLite.")
+        self._local = threading.local()
+        self._pool = None
+        self._pool_pid = None
+        self._pool_lock = threading.Lock()
+        if self.is_postgres:
+            logger.info("Using PostgreSQL article store.")
+        elif not os.path.exists(self.db_path):
             logger.info(f"Database file not found at {self.db_path}, creating a new one.")
         self._init_db()
         self.populate_feeds_from_config()
+        if not self.is_postgres:
+            # Build the known-URL Bloom filter now rather than on the first scrape
+            loaded = _url_filter(self.get_conn()).last_id
+            logger.info(f"Known-URL filter built (up to article id {loaded}).")
+
+    def _get_pg_conn(self):
+        with self._pool_lock:
+            # A forked child (gunicorn worker) must not reuse its parent's sockets
+            if self._pool is None or self._pool_pid != os.getpid():
+                self._pool = pg_store.open_pool(self.database_url)
+                self._pool_pid = os.getpid()
+            pool = self._pool
+        return pg_store.get_conn(pool)
 
     def get_conn(self):
-        return sqlite3.connect(self.db_path)
+        """
+        Returns this thread's connection, opening it on first use. Connections are
+        never shared between threads, and a forked child (gunicorn worker) opens
+        its own instead of reusing the parent's.
+
+        On PostgreSQL every call borrows a connection from the pool; close()
+        gives it back.
+        """
+        if self.is_postgres:
+            return self._get_pg_conn()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = _open_connection(self.db_path)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
 
     def _init_db(self):
         conn = self.get_conn()
+        if self.is_postgres:
+            try:
+                pg_store.init_db(conn)
+            finally:
+                conn.close()
+            return
         try:
-            cursor = conn.cursor()
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS articles (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT, url TEXT NOT NULL, canonical_url TEXT,
-                    source TEXT NOT NULL, section TEXT, title TEXT NOT NULL, description TEXT,
-                    image TEXT, author TEXT, date_published TEXT, date_modified TEXT, scraped_at TEXT NOT NULL
-                )
-            ''')
-            _add_column_if_not_exists(cursor, 'articles', 'canonical_url', 'TEXT')
-            _add_column_if_not_exists(cursor, 'articles', 'date_published', 'TEXT')
-            _add_column_if_not_exists(cursor, 'articles', 'date_modified', 'TEXT')
-            cursor.execute('CREATE UNIQUE INDEX IF NOT EXISTS ux_articles_source_section_canonical ON articles (source, section, canonical_url)')
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS feeds (
-                    source TEXT NOT NULL, path TEXT NOT NULL, display_name TEXT, last_refreshed_at TEXT,
-                    last_found_count INTEGER DEFAULT 0, last_added_count INTEGER DEFAULT 0, PRIMARY KEY (source, path)
-                )
-            ''')
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS processed_topics (
-                    topic_name TEXT PRIMARY KEY, json_data TEXT NOT NULL, updated_at TEXT NOT NULL
-                )
-            ''')
-            conn.commit()
-            logger.info("Database tables initialized successfully.")
+            _migrate(conn)
+            _detect_fts(conn)
         finally:
             conn.close()
 
     def populate_feeds_from_config(self):
         conn = self.get_conn()
         try:
-            cursor = conn.cursor()
+            feed_rows = []
             for source_key, source_data in SOURCES_CONFIG.items():
                 for section_key, section_data in source_data.get('sections', {}).items():
                     display_name = f"{source_data.get('name', source_key)} - {section_data.get('name', section_key)}"
-                    cursor.execute("INSERT OR IGNORE INTO feeds (source, path, display_name) VALUES (?, ?, ?)", (source_key, section_key, display_name))
-            conn.commit()
+                    feed_rows.append((source_key, section_key, display_name))
+            if self.is_postgres:
+                pg_store.add_feeds(conn, feed_rows)
+            else:
+                cursor = conn.cursor()
+                cursor.executemany("INSERT OR IGNORE INTO feeds (source, path, display_name) VALUES (?, ?, ?)", feed_rows)
+                conn.commit()
             logger.info("Feeds table populated/updated from SOURCES_CONFIG.")
-            
-            # Perform cleanups
-            self._perform_cleanup(cursor, conn, 'ole', ["/suscripciones/", "/estadisticas/", "/agenda/"])
-            self._perform_cleanup(cursor, conn, 'abola', ["/video/", "/a-bola-tv/"])
-
         finally:
             conn.close()
 
-    def _perform_cleanup(self, cursor, conn, source_name, patterns):
-        try:
-            logger.info(f"Performing cleanup of invalid {source_name} articles...")
-            like_conditions = " OR ".join(["url LIKE ?" for _ in patterns])
-            query = f"DELETE FROM articles WHERE source = ? AND ({like_conditions})"
-            params = [source_name] + [f'%{p}%' for p in patterns]
-            
-            cursor.execute(query, params)
-            deleted_count = cursor.rowcount
-            if deleted_count > 0:
-                logger.info(f"Cleaned up {deleted_count} invalid {source_name} articles.")
-            conn.commit()
-        except Exception as e:
-            logger.error(f"Failed to perform {source_name} cleanup: {e}")
\ No newline at end of file
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """
+    Returns the process-wide ArticleStore, creating it on first use. Schema migrations
+    and the feeds table sync run once, here, instead of on every construction.
+    """
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ArticleStore()
+        return _store
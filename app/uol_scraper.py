@@ -24,16 +24,8 @@ class UolScraper(BaseScraper):
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
         }
         self.session.headers.update(self.browser_headers)
-        
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=2, max=5))
-    def _fetch_page(self, url):
-        """Override to use enhanced browser headers for UOL requests"""
-        if not self.can_fetch(url):
-            logger.warning(f"Robots.txt disallows fetching {url}")
-            return None
-        
         # Enhanced browser headers for anti-bot protection
-        enhanced_headers = {
+        self.enhanced_headers = {
             **self.browser_headers,
             'sec-ch-ua': '"Chromium";v="91", " Not A;Brand";v="99"',
             'sec-ch-ua-mobile': '?0',
@@ -45,19 +37,34 @@ class UolScraper(BaseScraper):
             'accept-encoding': 'gzip, deflate, br',
             'cache-control': 'max-age=0'
         }
+    
+    def _send(self, url, headers=None, timeout=15, stream=False):
+        """Send every UOL request (articles and listings) with the enhanced browser headers"""
+        return super()._send(url, headers={**self.enhanced_headers, **(headers or {})}, timeout=timeout,
+                             stream=stream)
         
+    @staticmethod
+    def _amp_url(url):
+        """AMP version of a UOL page, or None when url already is one"""
+        if '/amp' in url or '?amp' in url:
+            return None
+        return url.rstrip('/') + '/amp'
+    
+    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=2, max=5))
+    def _download(self, url):
+        """Override to fall back to the AMP version of UOL pages when blocked"""
         try:
-            response = self.session.get(url, headers=enhanced_headers, timeout=15)
+            response = self._send(url, timeout=15)
             response.raise_for_status()
             return response.text
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403:
                 # Try AMP version as fallback
-                if '/amp' not in url and '?amp' not in url:
+                amp_url = self._amp_url(url)
+                if amp_url:
                     try:
-                        amp_url = url.rstrip('/') + '/amp'
                         logger.info(f"Trying AMP version: {amp_url}")
-                        response = self.session.get(amp_url, headers=enhanced_headers, timeout=15)
+                        response = self._send(amp_url, timeout=15)
                         response.raise_for_status()
                         return response.text
                     except:
@@ -68,6 +75,18 @@ class UolScraper(BaseScraper):
             logger.error(f"Error fetching {url}: {e}")
             raise
     
+    def _fetch_listing(self, url, cache_key=None):
+        """Listings fall back to their AMP version when blocked, like article pages"""
+        try:
+            return super()._fetch_listing(url, cache_key=cache_key)
+        except requests.exceptions.HTTPError as e:
+            amp_url = self._amp_url(url)
+            if e.response is None or e.response.status_code != 403 or not amp_url:
+                raise
+            logger.info(f"Trying AMP version: {amp_url}")
+            # Validators stay under the original URL, which is what list_pages saves them as
+            return super()._fetch_listing(amp_url, cache_key=cache_key or url)
+    
     def get_site_domain(self):
         """Return the main domain for UOL"""
         return "uol.com.br"
@@ -325,9 +344,9 @@ class UolScraper(BaseScraper):
         
         return None
     
-    def parse_article(self, url, source=None, section=None):
+    def parse_article_html(self, html, url, source=None, section=None):
         """Parse UOL article with specific handling"""
-        article = super().parse_article(url, source=source, section=section)
+        article = super().parse_article_html(html, url, source=source, section=section)
         
         if article:
             # Additional UOL-specific processing
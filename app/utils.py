@@ -74,20 +74,200 @@ def validate_admin_key(provided_key, expected_key):
     
     return provided_key == expected_key
 
+_QUERY_TOKEN_RE = re.compile(r'(-?)"([^"]*)"|\(|\)|\||[^\s()|"]+')
+
+
+def _fts_quote(text, prefix=False):
+    """FTS5 string literal for a term or phrase; a trailing * makes it a prefix query."""
+    return '"' + text.replace('"', '""') + '"' + ('*' if prefix else '')
+
+
+def _tsquery_term(words, prefix=False):
+    """Postgres to_tsquery operand for a term or phrase (words joined with <->)."""
+    return ' <-> '.join(words) + (':*' if prefix else '')
+
+
+def _drop_dangling_operators(parts):
+    """Removes ORs with no term on one side and empty "( )" groups from parsed query parts."""
+    cleaned = []
+    for part in parts:
+        if part == 'OR' and (not cleaned or cleaned[-1] in ('OR', '(')):
+            continue
+        if part == ')' and cleaned and cleaned[-1] in ('OR', '('):
+            if cleaned[-1] == '(':
+                cleaned.pop()
+                continue
+            cleaned.pop()
+        cleaned.append(part)
+    while cleaned and cleaned[-1] in ('OR', '('):
+        cleaned.pop()
+    return cleaned
+
+
+def _balance_parentheses(parts):
+    """
+    Drops operators left dangling by removed (negated/empty) terms; if the parentheses
+    do not balance, drops them all and cleans up again (") OR foo" must not leave "OR foo").
+    """
+    cleaned = _drop_dangling_operators(parts)
+    depth = 0
+    for part in cleaned:
+        depth += part == '('
+        depth -= part == ')'
+        if depth < 0:
+            break
+    if depth != 0:
+        cleaned = _drop_dangling_operators([part for part in cleaned if part not in ('(', ')')])
+    return cleaned
+
+
+def _conjoin(parts):
+    """Cleaned query parts with the implicit ANDs spelled out."""
+    # FTS5 only ANDs bare phrases implicitly; spell it out so groups can be combined too
+    expression = []
+    for part in _balance_parentheses(parts):
+        if expression and expression[-1] not in ('OR', '(') and part not in ('OR', ')'):
+            expression.append('AND')
+        expression.append(part)
+    return expression
+
+
+def _render(expression, syntax, operators):
+    return ' '.join(part[syntax] if isinstance(part, tuple) else operators.get(part, part)
+                    for part in expression) or None
+
+
+_TSQUERY_OPERATORS = {'AND': '&', 'OR': '|'}
+
+
 def parse_query_filter(query_string):
-    """Parse and validate query filter string"""
+    """
+    Parse the ?q= search syntax into a filter for get_recent_articles.
+
+    Supported syntax: words (all must match; AND or & between them is optional), "exact
+    phrases", OR (or |) between terms, NOT word or -word to exclude, word* for
+    prefixes and parentheses for grouping. NOT (...) or -(...) excludes a whole
+    group; negations nested inside an excluded group are ignored. Returns a dict with:
+      - 'raw': the sanitized query
+      - 'terms' / 'exclude': plain words for the LIKE fallback
+      - 'like': the included expression as a list of 'AND' / 'OR' / '(' / ')' and
+        (text,) terms, so the LIKE fallback keeps the same boolean structure
+      - 'fts': an FTS5 MATCH expression for the included terms (None if there are none)
+      - 'fts_exclude': an FTS5 expression matching the excluded terms and groups (or None)
+      - 'tsquery' / 'tsquery_exclude': the same two expressions in to_tsquery syntax
+    """
     if not query_string:
         return None
     
     # Basic sanitization - remove potentially dangerous characters
-    # Allow alphanumeric, spaces, and common punctuation
-    sanitized = re.sub(r'[^\w\s\-\|\(\)]+', '', query_string)
+    # Allow word characters, spaces, quotes and the query operators (& goes too: AND is implicit)
+    sanitized = re.sub(r'[^\w\s\-\|\(\)"\*]+', '', query_string)
     
     # Limit length to prevent abuse
     if len(sanitized) > 100:
         sanitized = sanitized[:100]
+    sanitized = sanitized.strip()
+    if not sanitized:
+        return None
+    
+    parts, terms, exclude, excluded = [], [], [], []
+    
+    def exclude_group(group_parts, group_terms):
+        expression = _conjoin(group_parts)
+        if not any(isinstance(part, tuple) for part in expression):
+            return
+        excluded.append((f"( {_render(expression, 0, {})} )", _render(expression, 1, _TSQUERY_OPERATORS)))
+        # NOT (a OR b) excludes each word; NOT (a b) cannot be expressed with word lists
+        if 'AND' not in expression:
+            exclude.extend(group_terms)
+    
+    # One entry per open parenthesis: (parts outside the group, group terms, excluded?)
+    groups = []
+    negate_next = False
+    for match in _QUERY_TOKEN_RE.finditer(sanitized):
+        token = match.group(0)
+        in_excluded = any(group[2] for group in groups)
+        if match.group(2) is not None:
+            text = match.group(2).strip()
+            if not text:
+                continue
+            negated, prefix = bool(match.group(1)) or negate_next, False
+        elif token == '(':
+            if negate_next:
+                # The negation covers the whole group, which is collected on its own
+                groups.append((parts, terms, True))
+                parts, terms = [], []
+            else:
+                groups.append((parts, terms, False))
+                parts.append(token)
+            negate_next = False
+            continue
+        elif token == ')':
+            negate_next = False
+            if not groups:
+                parts.append(token)  # unbalanced; dropped by _balance_parentheses
+                continue
+            outer_parts, outer_terms, group_excluded = groups.pop()
+            if not group_excluded:
+                parts.append(token)
+                continue
+            if not any(group[2] for group in groups):
+                exclude_group(parts, terms)
+            parts, terms = outer_parts, outer_terms
+            continue
+        elif token in ('|', 'OR'):
+            negate_next = False
+            parts.append('OR')
+            continue
+        elif token == 'AND':
+            # Terms are ANDed anyway; the explicit operator is not a search word
+            continue
+        elif token == 'NOT':
+            negate_next = True
+            continue
+        elif token.strip('-') == '':
+            # A bare "-" only negates a group that follows it directly
+            following = sanitized[match.end():match.end() + 1]
+            negate_next = following == '('
+            continue
+        else:
+            negated = token.startswith('-') or negate_next
+            text = token.lstrip('-')
+            prefix = text.endswith('*')
+            text = text.strip('*')
+        words = re.findall(r'\w+', text)
+        if not words:
+            continue
+        negate_next = False
+        # Each term is kept in both query syntaxes and as plain text: (FTS5, to_tsquery, LIKE)
+        expr = (_fts_quote(text, prefix), _tsquery_term(words, prefix), text)
+        if negated:
+            if not in_excluded:
+                excluded.append(expr)
+                exclude.append(text)
+        else:
+            parts.append(expr)
+            terms.append(text)
+    
+    # Groups left open at the end: an excluded one is closed implicitly
+    while groups:
+        outer_parts, outer_terms, group_excluded = groups.pop()
+        if group_excluded:
+            if not any(group[2] for group in groups):
+                exclude_group(parts, terms)
+            parts, terms = outer_parts, outer_terms
     
-    return sanitized.strip()
+    expression = _conjoin(parts)
+    return {
+        'raw': sanitized,
+        'terms': terms,
+        'exclude': exclude,
+        'like': [(part[2],) if isinstance(part, tuple) else part for part in expression],
+        'fts': _render(expression, 0, {}),
+        'fts_exclude': ' OR '.join(expr[0] for expr in excluded) or None,
+        'tsquery': _render(expression, 1, _TSQUERY_OPERATORS),
+        'tsquery_exclude': ' | '.join(f'({expr[1]})' for expr in excluded) or None,
+    }
 
 def format_rfc2822_date(dt):
     """Format datetime for RSS (RFC 2822)"""
@@ -0,0 +1,45 @@
+"""
+Parity of the lxml fast-path metadata extractor with the BeautifulSoup path.
+
+Every scraper class is run over the saved article pages in
+fixtures/article_pages with both extractors; the metadata must be identical,
+since sources switch to 'lxml' on the strength of this.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from app.parsed_document import ParsedDocument
+from app.scraper_factory import ScraperFactory
+
+FIXTURES = sorted((Path(__file__).parent / 'fixtures' / 'article_pages').glob('*.html'))
+URL = 'https://example.com/noticia/artigo.html'
+
+
+@pytest.fixture(scope='module', params=sorted(ScraperFactory.SCRAPER_CLASSES), ids=str)
+def scraper(request):
+    return ScraperFactory.SCRAPER_CLASSES[request.param](None)
+
+
+@pytest.mark.parametrize('fixture', FIXTURES, ids=lambda path: path.stem)
+def test_metadata_parity(scraper, fixture):
+    html = fixture.read_text(encoding='utf-8')
+    reference = scraper._extract_metadata(ParsedDocument(html, URL), URL)
+    fast_doc = ParsedDocument(html, URL, extractor='lxml')
+    fast = scraper._extract_metadata(fast_doc, URL)
+    assert fast == reference
+    # The fast path really ran, without building the soup
+    assert fast_doc.uses_lxml and 'soup' not in vars(fast_doc)
+
+
+@pytest.mark.parametrize('fixture', FIXTURES, ids=lambda path: path.stem)
+def test_fallback_metadata_parity(scraper, fixture):
+    html = fixture.read_text(encoding='utf-8')
+    reference = scraper.extract_fallback_metadata(ParsedDocument(html, URL), URL)
+    assert scraper.extract_fallback_metadata(ParsedDocument(html, URL, extractor='lxml'), URL) == reference
+
+
+def test_every_scraper_class_is_covered():
+    assert len(ScraperFactory.SCRAPER_CLASSES) == 16
+    assert len(FIXTURES) >= 10
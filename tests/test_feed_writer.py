@@ -0,0 +1,169 @@
+"""
+Differential tests of the streaming RSS/Atom writer (feed_writer) against feedgen.
+
+writer='stream' promises byte-for-byte feedgen output. That rests on feedgen
+and lxml serialization details (element order, escaping, date formats), so
+these tests render the same articles both ways and compare the documents.
+"""
+
+import random
+import re
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app import feed_writer
+from app.feeds import FeedGenerator
+
+FORMATS = ['rss', 'atom']
+_BASE = datetime(2024, 1, 1, tzinfo=timezone.utc)
+# Markup, quotes, CR/LF/tab, CDATA end, non-ASCII and astral characters
+_CHARS = 'abcdefghijklmnopqrstuvwxyzABCXYZ0123456789 &<>"\'\r\n\t]]>çãéü€😀'
+
+
+@pytest.fixture(scope='module')
+def generator():
+    return FeedGenerator()
+
+
+def render(generator, feed_format, articles, writer, **kwargs):
+    generate = getattr(generator, f'generate_{feed_format}')
+    document = generate(articles, source='ge', section='futebol', writer=writer, **kwargs)
+    # Feeds and entries without a date are dated "now", which differs between two renders
+    if not articles:
+        document = re.sub(r'<(lastBuildDate|updated)>[^<]*<', r'<\1><', document, count=1)
+    today = datetime.now(timezone.utc).date().isoformat()
+    return re.sub(today + r'T[0-9:.]+\+00:00', 'now', document)
+
+
+def outcome(generator, feed_format, articles, writer):
+    """The rendered document, or the type of the exception rendering raised."""
+    try:
+        return render(generator, feed_format, articles, writer)
+    except (TypeError, ValueError) as e:
+        return type(e)
+
+
+def assert_same_document(generator, feed_format, articles, **kwargs):
+    expected = render(generator, feed_format, articles, 'feedgen', **kwargs)
+    assert render(generator, feed_format, articles, 'stream', **kwargs) == expected
+
+
+def streams(generator, feed_format, articles):
+    """True when the streaming writer renders articles itself instead of falling back to feedgen."""
+    sorted_articles, dates = generator._sorted_articles(articles)
+    channel = generator._channel_metadata('ge', 'futebol', feed_format)
+    iter_feed = feed_writer.iter_rss if feed_format == 'rss' else feed_writer.iter_atom
+    return generator._stream(iter_feed, sorted_articles, dates, channel) is not None
+
+
+def article(i, **fields):
+    base = {
+        'url': f'https://ge.globo.com/futebol/noticia/{i}.ghtml', 'title': f'Título {i}',
+        'description': f'Descrição {i}', 'author': None,
+        'date_published': _BASE + timedelta(hours=i), 'fetched_at': _BASE + timedelta(days=90),
+    }
+    base.update(fields)
+    return base
+
+
+def random_text(rnd, length):
+    return ''.join(rnd.choice(_CHARS) for _ in range(length)).strip() or 'x'
+
+
+def random_articles(rnd):
+    articles = []
+    for i in range(rnd.randint(0, 8)):
+        articles.append({
+            'url': 'https://ex.com/a?x=1&y=' + re.sub(r'\s', '', random_text(rnd, 4)),
+            'title': random_text(rnd, 20),
+            'description': rnd.choice([random_text(rnd, 40), '', None]),
+            'author': rnd.choice(['', 'João <j@x.com>', random_text(rnd, 8), None]),
+            'date_published': rnd.choice([
+                _BASE + timedelta(hours=rnd.randint(0, 1000)), '2024-03-05T10:00:00-03:00',
+                '2024-03-05 10:00:00', 'Tue, 05 Mar 2024 10:00:00 GMT', None,
+            ]),
+            'fetched_at': _BASE + timedelta(days=rnd.randint(30, 60)),
+        })
+    return articles
+
+
+@pytest.mark.parametrize('feed_format', FORMATS)
+def test_random_articles(generator, feed_format):
+    rnd = random.Random(25)
+    streamed = 0
+    for _ in range(150):
+        articles = random_articles(rnd)
+        assert_same_document(generator, feed_format, articles)
+        streamed += streams(generator, feed_format, articles)
+    # Most documents must exercise the streaming writer, not its feedgen fallback
+    assert streamed > 100
+
+
+@pytest.mark.parametrize('feed_format', FORMATS)
+def test_typical_feed_streams(generator, feed_format):
+    articles = [article(i, author='Redação' if i % 2 else None) for i in range(30)]
+    assert streams(generator, feed_format, articles)
+    assert_same_document(generator, feed_format, articles)
+    assert_same_document(generator, feed_format, articles, title='Custom & <title>', description='Custom "desc"')
+
+
+@pytest.mark.parametrize('feed_format', FORMATS)
+def test_empty_feed(generator, feed_format):
+    assert_same_document(generator, feed_format, [])
+
+
+@pytest.mark.parametrize('feed_format', FORMATS)
+def test_duplicates_and_date_ties(generator, feed_format):
+    articles = [article(1), article(1), article(2, date_published=_BASE + timedelta(hours=1)),
+                article(3, link='https://ge.globo.com/futebol/noticia/link-over-url.ghtml')]
+    assert_same_document(generator, feed_format, articles)
+
+
+@pytest.mark.parametrize('feed_format', FORMATS)
+@pytest.mark.parametrize('fields', [
+    {'author': 'Redação'},
+    {'author': 'João <joao@example.com>'},
+    {'author': 'A & B "C"'},
+    {'summary': 'Summary wins over description'},
+    {'description': None},
+    {'description': ''},
+    {'date_published': None},
+    {'date_published': '2024-03-05T10:00:00.123456-03:00', 'date_modified': '2024-03-06T10:00:00Z'},
+], ids=['author_name', 'author_email', 'author_escaped', 'summary', 'no_description',
+        'empty_description', 'fetched_at_date', 'microseconds'])
+def test_entry_variants_stream(generator, feed_format, fields):
+    articles = [article(0), article(1, **fields)]
+    assert streams(generator, feed_format, articles)
+    assert_same_document(generator, feed_format, articles)
+
+
+@pytest.mark.parametrize('feed_format', FORMATS)
+@pytest.mark.parametrize('fields', [
+    {'date_published': None, 'fetched_at': None},
+    {'date_published': 'not a date', 'fetched_at': None},
+    {'author': 42},
+    {'title': 7},
+], ids=['no_date', 'unparseable_date', 'non_text_author', 'non_text_title'])
+def test_fallback_entries_match_feedgen(generator, feed_format, fields):
+    # _entry_fields hands these to feedgen, so the result (or error) must be the same
+    articles = [article(0), article(1, **fields)]
+    assert not streams(generator, feed_format, articles)
+    assert outcome(generator, feed_format, articles, 'stream') == outcome(generator, feed_format, articles, 'feedgen')
+
+
+@pytest.mark.parametrize('feed_format', FORMATS)
+@pytest.mark.parametrize('field', ['title', 'description', 'author'])
+def test_invalid_xml_characters_fall_back(generator, feed_format, field):
+    # lxml refuses control characters; the streaming writer must not emit them either
+    articles = [article(0), article(1, **{field: 'bad \x0b value'})]
+    assert not streams(generator, feed_format, articles)
+    assert outcome(generator, feed_format, articles, 'stream') == outcome(generator, feed_format, articles, 'feedgen')
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('text', True), ('', False), (None, False), (3, False),
+    ('tab\tnew\nline\rok', True), ('bell\x07', False), ('￾', False), ('😀', True),
+])
+def test_is_xml_text(value, expected):
+    assert feed_writer.is_xml_text(value) is expected
@@ -0,0 +1,179 @@
+"""
+PostgreSQL backend (pg_store) tests, run against the database in DATABASE_URL and
+skipped without one. Everything happens in a throwaway schema, and each check is
+made against a SQLite store fed the same articles, so the two backends are held
+to the same behaviour.
+"""
+
+import os
+import uuid
+from datetime import datetime, timedelta, timezone
+from urllib.parse import quote
+
+import pytest
+
+from app import store
+
+psycopg2 = pytest.importorskip('psycopg2')
+pg_store = pytest.importorskip('app.pg_store')
+
+DATABASE_URL = os.environ.get('DATABASE_URL')
+pytestmark = pytest.mark.skipif(not pg_store.is_postgres_url(DATABASE_URL),
+                                reason='DATABASE_URL does not point at PostgreSQL')
+
+
+@pytest.fixture
+def pg(monkeypatch):
+    schema = f"rssprime_test_{uuid.uuid4().hex[:12]}"
+    admin = psycopg2.connect(DATABASE_URL)
+    admin.autocommit = True
+    admin.cursor().execute(f'CREATE SCHEMA {schema}')
+    separator = '&' if '?' in DATABASE_URL else '?'
+    url = f"{DATABASE_URL}{separator}options={quote(f'-csearch_path={schema}')}"
+    monkeypatch.setattr(pg_store, 'PG_POOL_MIN', 1)
+    article_store = store.ArticleStore(database_url=url)
+    try:
+        yield article_store
+    finally:
+        article_store._pool.closeall()
+        admin.cursor().execute(f'DROP SCHEMA {schema} CASCADE')
+        admin.close()
+
+
+@pytest.fixture
+def lite(tmp_path):
+    article_store = store.ArticleStore(db_path=str(tmp_path / 'articles.db'), database_url='')
+    yield article_store
+    article_store.get_conn().really_close()
+
+
+@pytest.fixture
+def backends(pg, lite):
+    return {'postgres': pg, 'sqlite': lite}
+
+
+def call(article_store, function, *args, **kwargs):
+    conn = article_store.get_conn()
+    try:
+        return function(conn, *args, **kwargs)
+    finally:
+        conn.close()
+
+
+def article(slug, source='ge', section='futebol', fetched_at=None, **fields):
+    now = datetime.now(timezone.utc)
+    base = {
+        'url': f'https://{source}.example.com/{section}/{slug}.html', 'source': source, 'section': section,
+        'title': slug.replace('-', ' ').title(), 'description': '', 'image': None, 'author': None,
+        'date_published': now - timedelta(minutes=len(slug)), 'fetched_at': fetched_at or now,
+    }
+    base.update(fields)
+    return base
+
+
+def test_upsert(backends):
+    for name, article_store in backends.items():
+        batch = [article('a'), article('b'), article('a', description='same canonical URL')]
+        new = call(article_store, store.upsert_many, batch)
+        assert [a['url'] for a in new] == [batch[0]['url'], batch[1]['url']], name
+        # Conflicts are decided on the canonical URL within (source, section)
+        again = [article('a', url='https://ge.example.com/futebol/a.html?utm=x'), article('c'),
+                 article('a', section='volei')]
+        assert [a['url'] for a in call(article_store, store.upsert_many, again)] == [again[1]['url'], again[2]['url']], name
+        assert call(article_store, store.upsert_article, article('d')) is True, name
+        assert call(article_store, store.upsert_article, article('d')) is False, name
+        assert call(article_store, store.get_stats)['total_articles'] == 5, name
+
+
+def test_upsert_bumps_feed_versions(pg):
+    conn = pg.get_conn()
+    try:
+        store.upsert_many(conn, [article('a'), article('b', section='volei')])
+        store.upsert_many(conn, [article('c')])
+        store.upsert_many(conn, [article('c')])  # nothing new: no bump
+        versions = {(source, section): version for source, section, version in pg_store.get_feed_versions(conn)}
+    finally:
+        conn.close()
+    assert versions == {('ge', 'futebol'): 2, ('ge', 'volei'): 1}
+
+
+def test_known_urls(backends):
+    stored = [article('a'), article('b'), article('c', section='volei'), article('d', source='marca', section='futbol')]
+    probe = [a['url'] for a in stored] + [
+        'https://ge.example.com/futebol/a.html?ref=home#top',  # same canonical URL
+        'https://ge.example.com/futebol/never-stored.html',
+    ]
+    results = {}
+    for name, article_store in backends.items():
+        call(article_store, store.upsert_many, stored)
+        results[name] = (
+            call(article_store, store.known_urls, probe),
+            call(article_store, store.known_urls, probe, source='ge', section='futebol'),
+            call(article_store, store.known_urls, probe, source='marca', section='futbol'),
+        )
+    assert results['postgres'] == results['sqlite']
+    unscoped, ge_futebol, marca = results['postgres']
+    assert unscoped == set(probe[:5])
+    assert ge_futebol == {probe[0], probe[1], probe[4]}
+    assert marca == {probe[3]}
+
+
+_SEARCH_ARTICLES = [
+    article('real-madrid-vence', title='Real Madrid vence o clássico', description='Vinícius marca duas vezes'),
+    article('flamengo-empata', title='Flamengo empata no Maracanã', description='Jogo truncado'),
+    article('sao-paulo-contrata', title='São Paulo contrata atacante', description='Reforço para a temporada'),
+    article('palmeiras-lidera', title='Palmeiras lidera o Brasileirão', description='Real vantagem na tabela',
+            author='Redação'),
+    article('madrid-atletico', title='Atlético de Madrid perde', description='Derrota fora de casa'),
+    article('flamengo-real', title='Flamengo e Real Madrid: amistoso', description='Jogo em Orlando'),
+]
+
+
+@pytest.mark.parametrize('query', [
+    'real', 'real madrid', '"real madrid"', 'flam*', 'sao paulo', 'SÃO', 'maracana',
+    'real -flamengo', 'flamengo OR palmeiras', '(flamengo OR palmeiras) -real', 'NOT madrid',
+    # user-016 edge cases: the dangling OR must not reach to_tsquery
+    ') OR palmeiras', 'palmeiras OR (', 'redação', 'nothing-matches-this',
+])
+def test_search_matches_sqlite(backends, query):
+    results = {}
+    for name, article_store in backends.items():
+        call(article_store, store.upsert_many, _SEARCH_ARTICLES)
+        found = call(article_store, store.get_recent_articles, limit=50, query_filter=query,
+                     source='ge', section='futebol')
+        results[name] = [a['url'] for a in found]
+    assert results['postgres'] == results['sqlite']
+    if query != 'nothing-matches-this':
+        assert results['postgres'], query
+
+
+def test_search_uses_tsquery_without_error(pg):
+    # pg_store raises on an invalid to_tsquery; store.get_recent_articles would log and return []
+    call(pg, store.upsert_many, _SEARCH_ARTICLES)
+    conn = pg.get_conn()
+    try:
+        parsed = store.parse_query_filter(') OR palmeiras -real')
+        assert parsed['tsquery'] == 'palmeiras'
+        found = pg_store.get_recent_articles(conn, 0, 10, parsed, 'ge', 'futebol')
+    finally:
+        conn.close()
+    assert [a['url'] for a in found] == []  # the only Palmeiras article mentions "Real"
+
+
+def test_retention_matches_sqlite(backends):
+    now = datetime.now(timezone.utc)
+    articles = [article(f'old-{i}', fetched_at=now - timedelta(days=40 + i)) for i in range(5)]
+    articles += [article(f'new-{i}', fetched_at=now - timedelta(days=i)) for i in range(4)]
+    articles += [article('assinatura', source='ole', section='primera',
+                         url='https://ole.example.com/suscripciones/oferta.html')]
+    reports, remaining = {}, {}
+    for name, article_store in backends.items():
+        call(article_store, store.upsert_many, articles)
+        reports[name] = call(article_store, store.run_retention, days_to_keep=30, batch_size=2, pause=0)
+        remaining[name] = {a['url'] for a in call(article_store, store.get_recent_articles, limit=50, hours=24 * 365)}
+    for key in ('deleted', 'invalid_deleted'):
+        assert reports['postgres'][key] == reports['sqlite'][key], key
+    assert reports['postgres']['deleted'] == 5
+    assert reports['postgres']['invalid_deleted'] == 1
+    assert reports['postgres']['bytes_reclaimed'] is None
+    assert remaining['postgres'] == remaining['sqlite'] == {a['url'] for a in articles[5:9]}
@@ -0,0 +1,123 @@
+"""Tests for the ?q= search syntax parser (utils.parse_query_filter)."""
+
+import random
+import sqlite3
+
+import pytest
+
+from app.utils import parse_query_filter
+
+
+@pytest.mark.parametrize('query, fts, tsquery', [
+    ('real madrid', '"real" AND "madrid"', 'real & madrid'),
+    ('"real madrid" OR flam*', '"real madrid" OR "flam"*', 'real <-> madrid | flam:*'),
+    ('(foo OR bar) baz', '( "foo" OR "bar" ) AND "baz"', '( foo | bar ) & baz'),
+    ('foo | bar', '"foo" OR "bar"', 'foo | bar'),
+    # AND and & are the implicit conjunction, not search terms
+    ('flamengo AND paulo', '"flamengo" AND "paulo"', 'flamengo & paulo'),
+    ('flamengo & paulo', '"flamengo" AND "paulo"', 'flamengo & paulo'),
+    ('(a OR b) AND NOT c', '( "a" OR "b" )', '( a | b )'),
+    # Operators left dangling by excluded terms
+    ('-foo OR bar', '"bar"', 'bar'),
+    ('NOT foo | bar', '"bar"', 'bar'),
+    ('foo OR OR bar', '"foo" OR "bar"', 'foo | bar'),
+    ('foo OR (', '"foo"', 'foo'),
+    ('( OR bar', '"bar"', 'bar'),
+    # Unbalanced parentheses are dropped, then the operators they exposed
+    (') OR foo', '"foo"', 'foo'),
+    (') | foo', '"foo"', 'foo'),
+    ('foo ) OR ( bar', '"foo" OR "bar"', 'foo | bar'),
+    (') foo ( OR bar', '"foo" AND "bar"', 'foo & bar'),
+    ('((foo) OR', '"foo"', 'foo'),
+    # A negated group is excluded as a whole, not kept as a positive term
+    ('flamengo -(palmeiras OR paulo)', '"flamengo"', 'flamengo'),
+    ('flamengo NOT (palmeiras OR paulo)', '"flamengo"', 'flamengo'),
+    ('-(a OR b)', None, None),
+    ('foo - (bar)', '"foo" AND ( "bar" )', 'foo & ( bar )'),
+])
+def test_expressions(query, fts, tsquery):
+    parsed = parse_query_filter(query)
+    assert (parsed['fts'], parsed['tsquery']) == (fts, tsquery)
+
+
+def test_excluded_terms():
+    parsed = parse_query_filter('(foo OR bar) -baz NOT "qux quux"')
+    assert parsed['terms'] == ['foo', 'bar']
+    assert parsed['exclude'] == ['baz', 'qux quux']
+    assert parsed['fts_exclude'] == '"baz" OR "qux quux"'
+    assert parsed['tsquery_exclude'] == '(baz) | (qux <-> quux)'
+
+
+@pytest.mark.parametrize('query', ['foo -(a OR b)', 'foo NOT (a OR b)', 'foo NOT (a | b'])
+def test_excluded_groups(query):
+    parsed = parse_query_filter(query)
+    assert parsed['terms'] == ['foo']
+    assert parsed['exclude'] == ['a', 'b']
+    assert parsed['fts_exclude'] == '( "a" OR "b" )'
+    assert parsed['tsquery_exclude'] == '(a | b)'
+
+
+def test_excluded_conjunction_group():
+    parsed = parse_query_filter('foo -(a b) -c')
+    # NOT (a AND b) is not "neither a nor b": the LIKE fallback only gets the plain word
+    assert parsed['exclude'] == ['c']
+    assert parsed['fts_exclude'] == '( "a" AND "b" ) OR "c"'
+    assert parsed['tsquery_exclude'] == '(a & b) | (c)'
+    # Negations inside an excluded group are ignored
+    assert parse_query_filter('foo -(a -b)')['fts_exclude'] == '( "a" )'
+
+
+@pytest.mark.parametrize('query', ['', '   ', '<>;', 'OR', ')(', '( )'])
+def test_no_search_terms(query):
+    parsed = parse_query_filter(query)
+    assert parsed is None or (parsed['fts'] is None and parsed['tsquery'] is None)
+
+
+_FUZZ_TOKENS = ['(', ')', ' ', 'OR', '|', 'AND', '&', 'NOT', '-', '"', '*', 'foo', 'bar', 'são', 'a1', '-x', 'y*', '""', '-"p q"']
+
+
+def _fuzz_queries(count, seed=16):
+    rnd = random.Random(seed)
+    for _ in range(count):
+        yield ''.join(rnd.choice(_FUZZ_TOKENS) + rnd.choice(['', ' ']) for _ in range(rnd.randint(1, 10)))
+
+
+def _is_tsquery(expression):
+    """Structural check of a to_tsquery expression: operands and operators alternate, groups balance."""
+    expect_operand, depth = True, 0
+    for token in expression.split():
+        if token == '(':
+            if not expect_operand:
+                return False
+            depth += 1
+        elif token == ')':
+            if expect_operand or depth == 0:
+                return False
+            depth -= 1
+        elif token in ('&', '|', '<->'):
+            if expect_operand:
+                return False
+            expect_operand = True
+        else:
+            if not expect_operand:
+                return False
+            expect_operand = False
+    return depth == 0 and not expect_operand
+
+
+def test_fuzzed_queries_are_valid_fts5_and_tsquery():
+    conn = sqlite3.connect(':memory:')
+    try:
+        conn.execute("CREATE VIRTUAL TABLE t USING fts5(title, tokenize='unicode61 remove_diacritics 2')")
+    except sqlite3.OperationalError:
+        pytest.skip('SQLite built without FTS5')
+    for query in _fuzz_queries(5000):
+        parsed = parse_query_filter(query)
+        if not parsed:
+            continue
+        for expression in (parsed['fts'], parsed['fts_exclude']):
+            if expression:
+                conn.execute('SELECT * FROM t WHERE t MATCH ?', (expression,)).fetchall()
+        for expression in (parsed['tsquery'], parsed['tsquery_exclude']):
+            if expression:
+                assert _is_tsquery(expression.replace('(', ' ( ').replace(')', ' ) ')), (query, expression)